@@ -1,7 +1,8 @@
-import json
 import logging
 import os
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+import orjson
 
 from attendance.shared.model import AttendanceStatus
 from attendance.shared.utils.attendance_utils import (
@@ -11,7 +12,7 @@ from attendance.shared.utils.attendance_utils import (
 )
 from attendance.shared.utils.rekognition_utils import compare_faces_with_rekognition
 from constants.constants import FACE_SIMILARITY_THRESHOLD
-from utils.sns_utils import publish_attendance_notification
+from utils.sns_utils import publish_attendance_notifications_batch
 
 # Configure logging
 logger = logging.getLogger()
@@ -25,12 +26,13 @@ SIMILARITY_THRESHOLD = float(os.environ.get('FACE_SIMILARITY_THRESHOLD', FACE_SI
 SNS_TOPIC_ARN = os.environ.get('SNS_TOPIC_ARN')
 
 
-def process_single_message(message: Dict[str, Any]) -> Dict[str, Any]:
+def process_single_message(message: Dict[str, Any], pending_notifications: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Process a single SQS message for face comparison.
 
     Args:
         message: SQS message containing tracking_id, user_id, face_s3_key
+        pending_notifications: Collects notifications to publish once the batch is processed
 
     Returns:
         dict: Processing result with success status and details
@@ -40,21 +42,23 @@ def process_single_message(message: Dict[str, Any]) -> Dict[str, Any]:
     """
     try:
         # Parse message body
-        body = json.loads(message['body'])
+        body = orjson.loads(message['body'])
         tracking_id = body.get('tracking_id')
         user_id = body.get('user_id')
         attendance_face_s3_key = body.get('face_s3_key')
 
         logger.info(
-            f"Processing message - tracking_id: {tracking_id}, "
-            f"user_id: {user_id}, message_id: {message['messageId']}"
+            "Processing message - tracking_id: %s, "
+            "user_id: %s, message_id: %s",
+            tracking_id, user_id, message['messageId']
         )
 
         # Validate message fields
         if not all([tracking_id, user_id, attendance_face_s3_key]):
             logger.error(
-                f"Invalid message format - tracking_id: {tracking_id}, "
-                f"user_id: {user_id}, face_s3_key: {attendance_face_s3_key}"
+                "Invalid message format - tracking_id: %s, "
+                "user_id: %s, face_s3_key: %s",
+                tracking_id, user_id, attendance_face_s3_key
             )
             return {
                 'success': False,
@@ -66,7 +70,7 @@ def process_single_message(message: Dict[str, Any]) -> Dict[str, Any]:
         # Get attendance_date from a message
         attendance_date = body.get('attendance_date')
         if not attendance_date:
-            logger.error(f"attendance_date missing from message for tracking_id: {tracking_id}")
+            logger.error("attendance_date missing from message for tracking_id: %s", tracking_id)
             return {
                 'success': False,
                 'error': 'attendance_date missing from message',
@@ -84,8 +88,9 @@ def process_single_message(message: Dict[str, Any]) -> Dict[str, Any]:
 
             if attendance and attendance.status in [AttendanceStatus.VERIFIED, AttendanceStatus.FAILED]:
                 logger.info(
-                    f"Attendance already processed - tracking_id: {tracking_id}, "
-                    f"status: {attendance.status.value}, skipping"
+                    "Attendance already processed - tracking_id: %s, "
+                    "status: %s, skipping",
+                    tracking_id, attendance.status.value
                 )
                 return {
                     'success': True,
@@ -97,17 +102,17 @@ def process_single_message(message: Dict[str, Any]) -> Dict[str, Any]:
                 }
 
         except Exception as e:
-            logger.warning(f"Could not check existing attendance: {str(e)}")
+            logger.warning("Could not check existing attendance: %s", e)
             attendance = None
 
         try:
             student = get_student_by_user_id(STUDENTS_TABLE_NAME, user_id)
         except Exception as e:
-            logger.error(f"Failed to get student profile for user {user_id}: {str(e)}")
+            logger.error("Failed to get student profile for user %s: %s", user_id, e)
             raise
 
         if not student:
-            logger.error(f"Student not found for user_id: {user_id}")
+            logger.error("Student not found for user_id: %s", user_id)
             return {
                 'success': False,
                 'error': 'Student profile not found',
@@ -117,9 +122,10 @@ def process_single_message(message: Dict[str, Any]) -> Dict[str, Any]:
 
         if not student.face_registered or not student.face_s3_key:
             logger.error(
-                f"Student {user_id} does not have a registered face. "
-                f"face_registered: {student.face_registered}, "
-                f"face_s3_key: {student.face_s3_key}"
+                "Student %s does not have a registered face. "
+                "face_registered: %s, "
+                "face_s3_key: %s",
+                user_id, student.face_registered, student.face_s3_key
             )
             return {
                 'success': False,
@@ -131,9 +137,10 @@ def process_single_message(message: Dict[str, Any]) -> Dict[str, Any]:
         registered_face_s3_key = student.face_s3_key
 
         logger.info(
-            f"Comparing faces for user {user_id} - "
-            f"Registered: {registered_face_s3_key}, "
-            f"Attendance: {attendance_face_s3_key}"
+            "Comparing faces for user %s - "
+            "Registered: %s, "
+            "Attendance: %s",
+            user_id, registered_face_s3_key, attendance_face_s3_key
         )
 
         comparison_result = compare_faces_with_rekognition(
@@ -148,17 +155,19 @@ def process_single_message(message: Dict[str, Any]) -> Dict[str, Any]:
             similarity_score = comparison_result.similarity_score
             error_message = None
             logger.info(
-                f"Face verified for user {user_id} - "
-                f"Similarity: {similarity_score:.2f}%"
+                "Face verified for user %s - "
+                "Similarity: %.2f%%",
+                user_id, similarity_score
             )
         else:
             attendance_status = AttendanceStatus.FAILED
             similarity_score = comparison_result.similarity_score
             error_message = comparison_result.error_message
             logger.warning(
-                f"Face verification failed for user {user_id} - "
-                f"Error: {error_message}, "
-                f"Similarity: {similarity_score}"
+                "Face verification failed for user %s - "
+                "Error: %s, "
+                "Similarity: %s",
+                user_id, error_message, similarity_score
             )
         try:
             updated_attendance = update_attendance_status(
@@ -170,30 +179,29 @@ def process_single_message(message: Dict[str, Any]) -> Dict[str, Any]:
                 error_message=error_message
             )
             logger.info(
-                f"Successfully updated attendance record - "
-                f"attendance_id: {updated_attendance.attendance_id}, "
-                f"status: {updated_attendance.status.value}"
+                "Successfully updated attendance record - "
+                "attendance_id: %s, "
+                "status: %s",
+                updated_attendance.attendance_id, updated_attendance.status.value
             )
         except Exception as e:
-            logger.error(f"Failed to update attendance record: {str(e)}")
+            logger.error("Failed to update attendance record: %s", e)
             raise
 
-        try:
-            if SNS_TOPIC_ARN:
-                publish_attendance_notification(
-                    topic_arn=SNS_TOPIC_ARN,
-                    status=attendance_status.value,
-                    similarity_score=similarity_score,
-                    error_message=error_message
-                )
-                logger.info(
-                    f"Published {attendance_status.value} notification for tracking_id: {tracking_id}, "
-                    f"similarity: {similarity_score}"
-                )
-            else:
-                logger.warning("SNS_TOPIC_ARN not configured, skipping notification")
-        except Exception as e:
-            logger.error(f"Failed to send SNS notification: {str(e)}")
+        if SNS_TOPIC_ARN:
+            # Published together with the rest of the batch in one PublishBatch call
+            pending_notifications.append({
+                'status': attendance_status.value,
+                'similarity_score': similarity_score,
+                'error_message': error_message
+            })
+            logger.info(
+                "Queued %s notification for tracking_id: %s, "
+                "similarity: %s",
+                attendance_status.value, tracking_id, similarity_score
+            )
+        else:
+            logger.warning("SNS_TOPIC_ARN not configured, skipping notification")
 
         return {
             'success': True,
@@ -205,7 +213,7 @@ def process_single_message(message: Dict[str, Any]) -> Dict[str, Any]:
 
     except Exception as e:
         logger.error(
-            f"Error processing message {message['messageId']}: {str(e)}",
+            "Error processing message %s: %s", message['messageId'], e,
             exc_info=True
         )
         raise
@@ -225,13 +233,14 @@ def handler(event, context):
     Returns:
         dict: Batch item failures for SQS partial batch failure handling
     """
-    logger.info(f"Received {len(event['Records'])} messages for processing")
+    logger.info("Received %s messages for processing", len(event['Records']))
 
     batch_item_failures = []
+    pending_notifications = []
 
     for record in event['Records']:
         try:
-            result = process_single_message(record)
+            result = process_single_message(record, pending_notifications)
 
             if not result['success']:
                 if result.get('retryable', True):
@@ -239,35 +248,59 @@ def handler(event, context):
                         'itemIdentifier': record['messageId']
                     })
                     logger.warning(
-                        f"Message {record['messageId']} failed (retryable): "
-                        f"{result.get('error')}"
+                        "Message %s failed (retryable): "
+                        "%s",
+                        record['messageId'], result.get('error')
                     )
                 else:
                     logger.error(
-                        f"Message {record['messageId']} failed (non-retryable): "
-                        f"{result.get('error')}"
+                        "Message %s failed (non-retryable): "
+                        "%s",
+                        record['messageId'], result.get('error')
                     )
             else:
                 logger.info(
-                    f"Successfully processed message {record['messageId']} - "
-                    f"tracking_id: {result.get('tracking_id')}"
+                    "Successfully processed message %s - "
+                    "tracking_id: %s",
+                    record['messageId'], result.get('tracking_id')
                 )
 
         except Exception as e:
             logger.error(
-                f"Unexpected error processing message {record['messageId']}: {str(e)}",
+                "Unexpected error processing message %s: %s", record['messageId'], e,
                 exc_info=True
             )
             batch_item_failures.append({
                 'itemIdentifier': record['messageId']
             })
 
+    _publish_notifications(pending_notifications)
+
     logger.info(
-        f"Batch processing complete - "
-        f"Success: {len(event['Records']) - len(batch_item_failures)}, "
-        f"Failed: {len(batch_item_failures)}"
+        "Batch processing complete - "
+        "Success: %s, "
+        "Failed: %s",
+        len(event['Records']) - len(batch_item_failures), len(batch_item_failures)
     )
 
     return {
         'batchItemFailures': batch_item_failures
     }
+
+
+def _publish_notifications(pending_notifications: List[Dict[str, Any]]) -> None:
+    """
+    Publish the batch's attendance notifications in as few SNS calls as possible.
+
+    Failures are logged and not retried; the attendance records are already
+    updated, so a lost email must not send the messages back to the queue.
+
+    Args:
+        pending_notifications: Notifications collected by process_single_message
+    """
+    if not pending_notifications:
+        return
+
+    failed_count = publish_attendance_notifications_batch(SNS_TOPIC_ARN, pending_notifications)
+    if failed_count:
+        logger.error("Failed to send %s of %s SNS notifications", failed_count, len(pending_notifications))
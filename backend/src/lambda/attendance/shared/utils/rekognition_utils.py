@@ -5,6 +5,9 @@ from utils.aws_utils import get_client_for_resource
 
 logger = logging.getLogger()
 
+# Rekognition client created once per execution environment and reused across warm invocations
+rekognition_client = get_client_for_resource('rekognition')
+
 
 class FaceComparisonResult:
     """Result of face comparison operation."""
@@ -48,12 +51,11 @@ def compare_faces_with_rekognition(
     Returns:
         FaceComparisonResult: Contains success status, similarity score, and error details
     """
-    rekognition_client = get_client_for_resource('rekognition')
-
     try:
         logger.info(
-            f"Comparing faces - Source: {source_s3_key}, Target: {target_s3_key}, "
-            f"Threshold: {similarity_threshold}"
+            "Comparing faces - Source: %s, Target: %s, "
+            "Threshold: %s",
+            source_s3_key, target_s3_key, similarity_threshold
         )
 
         # Call Rekognition CompareImages API
@@ -82,8 +84,9 @@ def compare_faces_with_rekognition(
             if unmatched_faces:
                 # Face was detected but similarity is below threshold
                 logger.warning(
-                    f"Face detected but similarity below threshold. "
-                    f"Unmatched faces count: {len(unmatched_faces)}"
+                    "Face detected but similarity below threshold. "
+                    "Unmatched faces count: %s",
+                    len(unmatched_faces)
                 )
                 return FaceComparisonResult(
                     success=False,
@@ -107,13 +110,14 @@ def compare_faces_with_rekognition(
         face_details = best_match['Face']
 
         logger.info(
-            f"Face match found - Similarity: {similarity_score:.2f}%, "
-            f"Confidence: {face_details.get('Confidence', 0):.2f}%"
+            "Face match found - Similarity: %.2f%%, "
+            "Confidence: %.2f%%",
+            similarity_score, face_details.get('Confidence', 0)
         )
 
         # Check if multiple faces were detected
         if len(face_matches) > 1:
-            logger.warning(f"Multiple matching faces detected: {len(face_matches)}")
+            logger.warning("Multiple matching faces detected: %s", len(face_matches))
             return FaceComparisonResult(
                 success=False,
                 similarity_score=similarity_score,
@@ -130,7 +134,7 @@ def compare_faces_with_rekognition(
         )
 
     except rekognition_client.exceptions.InvalidParameterException as e:
-        logger.error(f"Invalid parameter for Rekognition: {str(e)}")
+        logger.error("Invalid parameter for Rekognition: %s", e)
         return FaceComparisonResult(
             success=False,
             similarity_score=None,
@@ -139,7 +143,7 @@ def compare_faces_with_rekognition(
         )
 
     except rekognition_client.exceptions.ImageTooLargeException as e:
-        logger.error(f"Image too large: {str(e)}")
+        logger.error("Image too large: %s", e)
         return FaceComparisonResult(
             success=False,
             similarity_score=None,
@@ -148,7 +152,7 @@ def compare_faces_with_rekognition(
         )
 
     except rekognition_client.exceptions.InvalidS3ObjectException as e:
-        logger.error(f"Invalid S3 object: {str(e)}")
+        logger.error("Invalid S3 object: %s", e)
         return FaceComparisonResult(
             success=False,
             similarity_score=None,
@@ -157,7 +161,7 @@ def compare_faces_with_rekognition(
         )
 
     except rekognition_client.exceptions.InvalidImageFormatException as e:
-        logger.error(f"Invalid image format: {str(e)}")
+        logger.error("Invalid image format: %s", e)
         return FaceComparisonResult(
             success=False,
             similarity_score=None,
@@ -166,12 +170,12 @@ def compare_faces_with_rekognition(
         )
 
     except rekognition_client.exceptions.ProvisionedThroughputExceededException as e:
-        logger.error(f"Rekognition throttled: {str(e)}")
+        logger.error("Rekognition throttled: %s", e)
         # Don't return a result - let this propagate so SQS can retry
         raise Exception("Face recognition service temporarily unavailable. Retrying...") from e
 
     except Exception as e:
-        logger.error(f"Unexpected error during face comparison: {str(e)}", exc_info=True)
+        logger.error("Unexpected error during face comparison: %s", e, exc_info=True)
         # For unexpected errors, let SQS retry
         raise Exception(f"Face comparison failed: {str(e)}") from e
 
@@ -191,8 +195,6 @@ def validate_face_image_quality(
     Returns:
         dict: Quality information including face count, confidence, etc.
     """
-    rekognition_client = get_client_for_resource('rekognition')
-
     try:
         response = rekognition_client.detect_faces(
             Image={
@@ -213,7 +215,7 @@ def validate_face_image_quality(
         }
 
     except Exception as e:
-        logger.error(f"Error validating image quality: {str(e)}")
+        logger.error("Error validating image quality: %s", e)
         return {
             'valid': False,
             'face_count': 0,
@@ -8,10 +8,10 @@ import logging
 import os
 from typing import Any, Dict
 
-import boto3
 from botocore.exceptions import ClientError
 
 from schedule.shared.model.ScheduleModel import ScheduleModel
+from utils import aws_utils
 from utils.api_response import APIResponse
 from utils.request_utils import extract_path_parameter
 
@@ -23,7 +23,7 @@ logger.setLevel(logging.INFO)
 CLASS_SCHEDULES_TABLE_NAME = os.environ.get('CLASS_SCHEDULES_TABLE_NAME')
 
 # Initialize DynamoDB resource
-dynamodb = boto3.resource('dynamodb')
+dynamodb = aws_utils.get_dynamodb_resource(read_only=True)
 schedules_table = dynamodb.Table(CLASS_SCHEDULES_TABLE_NAME)
 
 
@@ -47,12 +47,12 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         if error:
             return error
 
-        logger.info(f"Fetching schedule with ID: {schedule_id} for university: {university_code}")
+        logger.info("Fetching schedule with ID: %s for university: %s", schedule_id, university_code)
 
         # Validate that schedule_id starts with university_code
         expected_prefix = f"{university_code.upper()}_"
         if not schedule_id.upper().startswith(expected_prefix):
-            logger.warning(f"Schedule ID {schedule_id} does not match university code {university_code}")
+            logger.warning("Schedule ID %s does not match university code %s", schedule_id, university_code)
             return APIResponse.bad_request(f'Schedule ID must start with {expected_prefix}')
 
         # Query DynamoDB by schedule_id (partition key)
@@ -62,20 +62,20 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
 
         # Check if schedule exists
         if 'Item' not in response:
-            logger.warning(f"Schedule not found for ID: {schedule_id}")
+            logger.warning("Schedule not found for ID: %s", schedule_id)
             return APIResponse.not_found(f'Schedule with ID {schedule_id} not found', resource_type='Schedule')
 
         # Parse DynamoDB item to ScheduleModel
         schedule_item = response['Item']
         schedule = ScheduleModel.from_dynamodb_item(schedule_item)
 
-        logger.info(f"Successfully retrieved schedule: {schedule_id}")
+        logger.info("Successfully retrieved schedule: %s", schedule_id)
         return APIResponse.ok(schedule.to_dict())
 
     except ClientError as e:
-        logger.error(f"DynamoDB error: {str(e)}")
+        logger.error("DynamoDB error: %s", e)
         return APIResponse.internal_error('Failed to fetch schedule')
 
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         return APIResponse.internal_error('An unexpected error occurred')
@@ -2,10 +2,10 @@ import logging
 import os
 from typing import Any, Dict
 
-import boto3
 from botocore.exceptions import ClientError
 
 from schedule.shared.model.ScheduleModel import ScheduleModel
+from utils import aws_utils
 from utils.api_response import APIResponse
 from utils.auth_utils import require_role, UserRole, AuthorizationError, create_forbidden_response
 from utils.pagination_utils import decode_last_evaluated_key, parse_page_size, build_pagination_response
@@ -19,7 +19,7 @@ logger.setLevel(logging.INFO)
 CLASS_SCHEDULES_TABLE_NAME = os.environ.get('CLASS_SCHEDULES_TABLE_NAME')
 
 # Initialize DynamoDB resource
-dynamodb = boto3.resource('dynamodb')
+dynamodb = aws_utils.get_dynamodb_resource(read_only=True)
 class_schedules_table = dynamodb.Table(CLASS_SCHEDULES_TABLE_NAME)
 
 # Constants
@@ -43,9 +43,9 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         # Check authorization - Admin and Instructor can list schedules
         try:
             user_context = require_role(event, [UserRole.ADMIN, UserRole.INSTRUCTOR])
-            logger.info(f"User {user_context['user_id']} authorized for list schedules")
+            logger.info("User %s authorized for list schedules", user_context['user_id'])
         except AuthorizationError as e:
-            logger.warning(f"Authorization failed: {str(e)}")
+            logger.warning("Authorization failed: %s", e)
             return create_forbidden_response()
 
         # Extract query parameters
@@ -60,7 +60,9 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         exclusive_start_key = decode_last_evaluated_key(last_key_param)
 
         logger.info(
-            f"Listing schedules with page_size: {page_size}, university_code: {university_code}, has_last_key: {bool(exclusive_start_key)}")
+            "Listing schedules with page_size: %s, university_code: %s, has_last_key: %s",
+            page_size, university_code, bool(exclusive_start_key)
+        )
 
         # Scan DynamoDB table with pagination
         scan_params = {
@@ -86,34 +88,26 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 schedule = ScheduleModel.from_dynamodb_item(item)
                 schedules.append(schedule.to_dict())
             except Exception as e:
-                logger.error(f"Error parsing schedule item: {str(e)}")
+                logger.error("Error parsing schedule item: %s", e)
                 continue
 
         # Sort schedules by course_name for consistent ordering
         schedules.sort(key=lambda x: x.get('course_name', '').lower())
 
-        # Build pagination response
-        pagination_data = build_pagination_response(
+        # Build pagination response under the 'schedules' key for API consistency
+        response_data = build_pagination_response(
             items=schedules,
-            last_evaluated_key=response.get('LastEvaluatedKey')
+            last_evaluated_key=response.get('LastEvaluatedKey'),
+            items_key='schedules'
         )
 
-        # Rename 'items' to 'schedules' for API consistency
-        response_data = {
-            'schedules': pagination_data['items'],
-            'count': pagination_data['count'],
-            'has_more': pagination_data['has_more']
-        }
-        if 'last_evaluated_key' in pagination_data:
-            response_data['last_evaluated_key'] = pagination_data['last_evaluated_key']
-
-        logger.info(f"Successfully retrieved {len(schedules)} schedules")
+        logger.info("Successfully retrieved %s schedules", len(schedules))
         return APIResponse.ok(response_data)
 
     except ClientError as e:
-        logger.error(f"DynamoDB error: {str(e)}")
+        logger.error("DynamoDB error: %s", e)
         return APIResponse.internal_error('Failed to list schedules')
 
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         return APIResponse.internal_error('An unexpected error occurred')
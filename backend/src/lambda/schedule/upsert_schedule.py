@@ -9,11 +9,11 @@ import os
 from datetime import datetime, timezone
 from typing import Any, Dict
 
-import boto3
 from botocore.exceptions import ClientError
 from pydantic import ValidationError
 
 from schedule.shared.model.ScheduleModel import ScheduleModel
+from utils import aws_utils
 from utils.api_response import APIResponse
 from utils.auth_utils import require_role, UserRole, AuthorizationError, create_forbidden_response
 from utils.request_utils import parse_json_body, extract_path_parameter, validate_required_fields
@@ -26,7 +26,7 @@ logger.setLevel(logging.INFO)
 CLASS_SCHEDULES_TABLE_NAME = os.environ.get('CLASS_SCHEDULES_TABLE_NAME')
 
 # Initialize DynamoDB resource
-dynamodb = boto3.resource('dynamodb')
+dynamodb = aws_utils.get_dynamodb_resource()
 schedules_table = dynamodb.Table(CLASS_SCHEDULES_TABLE_NAME)
 
 
@@ -45,9 +45,9 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         # Check authorization - Admin or Instructor can upsert schedules
         try:
             user_context = require_role(event, [UserRole.ADMIN, UserRole.INSTRUCTOR])
-            logger.info(f"User {user_context['user_id']} authorized with groups: {user_context['groups']}")
+            logger.info("User %s authorized with groups: %s", user_context['user_id'], user_context['groups'])
         except AuthorizationError as e:
-            logger.warning(f"Authorization failed: {str(e)}")
+            logger.warning("Authorization failed: %s", e)
             return create_forbidden_response()
 
         # Extract path parameters
@@ -61,12 +61,12 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             return error
         schedule_id = schedule_id.upper()
 
-        logger.info(f"Processing upsert for schedule ID: {schedule_id}")
+        logger.info("Processing upsert for schedule ID: %s", schedule_id)
 
         # Validate that schedule_id starts with university_code
         expected_prefix = f"{university_code}_"
         if not schedule_id.startswith(expected_prefix):
-            logger.warning(f"Schedule ID {schedule_id} does not match university code {university_code}")
+            logger.warning("Schedule ID %s does not match university code %s", schedule_id, university_code)
             return APIResponse.bad_request(f'Schedule ID must start with {expected_prefix}')
 
         # Parse request body
@@ -83,14 +83,14 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         # Extract course_id from schedule_id (format: UNIVERSITY_COURSEID)
         parts = schedule_id.split('_', 1)
         if len(parts) != 2:
-            logger.warning(f"Invalid schedule_id format: {schedule_id}")
+            logger.warning("Invalid schedule_id format: %s", schedule_id)
             return APIResponse.bad_request('Schedule ID must be in format UNIVERSITYCODE_COURSEID (e.g., PITT_CS2060)')
 
         course_id = parts[1]
 
         # Check if schedule_id in body matches path parameter (if provided)
         if 'schedule_id' in body and body['schedule_id'].upper() != schedule_id:
-            logger.warning(f"Mismatched schedule_id in path and body")
+            logger.warning("Mismatched schedule_id in path and body")
             return APIResponse.bad_request('Schedule ID in path must match schedule_id in body')
 
         # Check if schedule already exists
@@ -108,7 +108,9 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 existing_instructor_id = existing_schedule.get('instructor_id')
                 if existing_instructor_id and existing_instructor_id != user_context['user_id']:
                     logger.warning(
-                        f"Instructor {user_context['user_id']} attempted to modify schedule owned by {existing_instructor_id}")
+                        "Instructor %s attempted to modify schedule owned by %s",
+                        user_context['user_id'], existing_instructor_id
+                    )
                     return create_forbidden_response()
 
         current_time = datetime.now(timezone.utc)
@@ -138,13 +140,13 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         try:
             schedule_model = ScheduleModel.from_dict(schedule_data)
         except ValidationError as ve:
-            logger.warning(f"Validation error: {str(ve)}")
+            logger.warning("Validation error: %s", ve)
             return APIResponse.unprocessable_entity('Validation error', errors=ve.errors())
 
         # Save to DynamoDB
         schedules_table.put_item(Item=schedule_model.to_dynamodb_item())
 
-        logger.info(f"Successfully {'updated' if is_update else 'created'} schedule: {schedule_id}")
+        logger.info("Successfully %s schedule: %s", 'updated' if is_update else 'created', schedule_id)
 
         if is_update:
             return APIResponse.ok(schedule_model.to_dict())
@@ -152,9 +154,9 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             return APIResponse.created(schedule_model.to_dict())
 
     except ClientError as e:
-        logger.error(f"DynamoDB error: {str(e)}")
+        logger.error("DynamoDB error: %s", e)
         return APIResponse.internal_error('Failed to upsert schedule')
 
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         return APIResponse.internal_error('An unexpected error occurred')
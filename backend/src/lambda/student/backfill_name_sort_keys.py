@@ -0,0 +1,116 @@
+"""
+Backfill Student Name Sort Keys Lambda Handler
+
+One-off migration for students written before the by-tenant-name GSI
+existed. Sets the lowercased name columns, tenant and name_sort_key on every
+student that lacks them, so the student appears in list_students. Not exposed
+through API Gateway; invoke it directly until it reports no remaining key:
+
+    aws lambda invoke --function-name backfill-student-name-keys \\
+        --payload '{"exclusive_start_key": <last_evaluated_key>}' out.json
+"""
+
+import logging
+import os
+from typing import Any, Dict
+
+from botocore.exceptions import ClientError
+
+from student.shared.model.StudentModel import DEFAULT_TENANT, student_name_sort_key
+from utils import aws_utils
+
+# Configure logging
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# Environment variables
+STUDENTS_TABLE_NAME = os.environ.get('STUDENTS_TABLE_NAME')
+
+# Initialize DynamoDB resource
+dynamodb = aws_utils.get_dynamodb_resource()
+students_table = dynamodb.Table(STUDENTS_TABLE_NAME)
+
+# Constants
+MISSING_SORT_KEY_FILTER = 'attribute_not_exists(name_sort_key)'
+# The row must still exist and must not have been re-saved since the scan read it
+BACKFILL_CONDITION = 'attribute_exists(user_id) AND attribute_not_exists(name_sort_key)'
+BACKFILL_UPDATE_EXPRESSION = (
+    'SET first_name_lc = :first_name_lc, last_name_lc = :last_name_lc, '
+    'tenant = :tenant, name_sort_key = :name_sort_key'
+)
+# Stop scanning with this much time left so the last page's updates can finish
+MIN_REMAINING_MILLIS = 30_000
+
+
+def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Lambda handler to backfill the by-tenant-name GSI keys on students.
+
+    Args:
+        event: Optional 'exclusive_start_key' returned by a previous invocation
+        context: Lambda context object
+
+    Returns:
+        Number of students updated and the 'last_evaluated_key' to resume
+        from, which is None once the whole table has been scanned
+    """
+    scan_params = {
+        'FilterExpression': MISSING_SORT_KEY_FILTER,
+        'ProjectionExpression': 'user_id, first_name, last_name',
+    }
+    if event.get('exclusive_start_key'):
+        scan_params['ExclusiveStartKey'] = event['exclusive_start_key']
+
+    updated_count = 0
+    last_evaluated_key = None
+
+    while True:
+        response = students_table.scan(**scan_params)
+
+        for item in response.get('Items', []):
+            if _backfill_student(item):
+                updated_count += 1
+
+        last_evaluated_key = response.get('LastEvaluatedKey')
+        if not last_evaluated_key or context.get_remaining_time_in_millis() < MIN_REMAINING_MILLIS:
+            break
+        scan_params['ExclusiveStartKey'] = last_evaluated_key
+
+    logger.info("Backfilled %s students, has_more: %s", updated_count, bool(last_evaluated_key))
+    return {
+        'updated_count': updated_count,
+        'last_evaluated_key': last_evaluated_key
+    }
+
+
+def _backfill_student(item: Dict[str, Any]) -> bool:
+    """
+    Set the lowercased names, tenant and name_sort_key on a single student.
+
+    Args:
+        item: Student item with user_id, first_name and last_name
+
+    Returns:
+        True if the item was updated, False if it changed since it was scanned
+    """
+    user_id = item['user_id']
+    first_name_lc = item.get('first_name', '').lower()
+    last_name_lc = item.get('last_name', '').lower()
+    try:
+        students_table.update_item(
+            Key={'user_id': user_id},
+            UpdateExpression=BACKFILL_UPDATE_EXPRESSION,
+            ConditionExpression=BACKFILL_CONDITION,
+            ExpressionAttributeValues={
+                ':first_name_lc': first_name_lc,
+                ':last_name_lc': last_name_lc,
+                ':tenant': DEFAULT_TENANT,
+                ':name_sort_key': student_name_sort_key(first_name_lc, last_name_lc, user_id),
+            }
+        )
+    except ClientError as e:
+        if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+            raise
+        logger.info("Student %s changed during backfill, skipping", user_id)
+        return False
+    return True
@@ -9,11 +9,11 @@ import os
 from datetime import datetime, timezone
 from typing import Any, Dict
 
-import boto3
 from botocore.exceptions import ClientError
 
 from schedule.shared.model.ScheduleModel import ScheduleModel
 from student.shared.model.StudentCoursesModel import StudentCourseModel
+from utils import aws_utils
 from utils.api_response import APIResponse
 from utils.auth_utils import require_role, UserRole, AuthorizationError, create_forbidden_response
 from utils.request_utils import parse_json_body, extract_path_parameter
@@ -27,7 +27,7 @@ STUDENT_COURSES_TABLE_NAME = os.environ.get('STUDENT_COURSES_TABLE_NAME')
 CLASS_SCHEDULES_TABLE_NAME = os.environ.get('CLASS_SCHEDULES_TABLE_NAME')
 
 # Initialize DynamoDB resource
-dynamodb = boto3.resource('dynamodb')
+dynamodb = aws_utils.get_dynamodb_resource()
 student_courses_table = dynamodb.Table(STUDENT_COURSES_TABLE_NAME)
 class_schedules_table = dynamodb.Table(CLASS_SCHEDULES_TABLE_NAME)
 
@@ -48,9 +48,9 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         # Check authorization - only Admin can enroll students
         try:
             user_context = require_role(event, [UserRole.ADMIN])
-            logger.info(f"User {user_context['user_id']} authorized as Admin for enroll student")
+            logger.info("User %s authorized as Admin for enroll student", user_context['user_id'])
         except AuthorizationError as e:
-            logger.warning(f"Authorization failed: {str(e)}")
+            logger.warning("Authorization failed: %s", e)
             return create_forbidden_response()
 
         # Extract path parameters
@@ -69,7 +69,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             logger.warning("Missing or invalid schedule_ids in request body")
             return APIResponse.bad_request('schedule_ids must be a non-empty array')
 
-        logger.info(f"Enrolling student {user_id} in {len(schedule_ids)} courses")
+        logger.info("Enrolling student %s in %s courses", user_id, len(schedule_ids))
 
         enrolled = []
         failed = []
@@ -83,7 +83,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 )
 
                 if 'Item' not in schedule_response:
-                    logger.warning(f"Schedule not found: {schedule_id}")
+                    logger.warning("Schedule not found: %s", schedule_id)
                     failed.append({
                         'schedule_id': schedule_id,
                         'error': 'Schedule not found'
@@ -103,13 +103,13 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                     )
 
                     if 'Item' in existing_response:
-                        logger.info(f"Student {user_id} already enrolled in course {schedule.course_id}")
+                        logger.info("Student %s already enrolled in course %s", user_id, schedule.course_id)
                         # Return existing enrollment as success
                         existing_enrollment = StudentCourseModel.from_dynamodb_item(existing_response['Item'])
                         enrolled.append(existing_enrollment.to_dict())
                         continue
                 except ClientError as e:
-                    logger.error(f"Error checking existing enrollment: {str(e)}")
+                    logger.error("Error checking existing enrollment: %s", e)
 
                 # Create enrollment record
                 enrollment_date = datetime.now(timezone.utc).isoformat()
@@ -126,16 +126,16 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 student_courses_table.put_item(Item=enrollment.to_dynamodb_item())
 
                 enrolled.append(enrollment.to_dict())
-                logger.info(f"Successfully enrolled student {user_id} in course {schedule.course_id}")
+                logger.info("Successfully enrolled student %s in course %s", user_id, schedule.course_id)
 
             except Exception as e:
-                logger.error(f"Error enrolling in schedule {schedule_id}: {str(e)}")
+                logger.error("Error enrolling in schedule %s: %s", schedule_id, e)
                 failed.append({
                     'schedule_id': schedule_id,
                     'error': str(e)
                 })
 
-        logger.info(f"Enrollment complete. Enrolled: {len(enrolled)}, Failed: {len(failed)}")
+        logger.info("Enrollment complete. Enrolled: %s, Failed: %s", len(enrolled), len(failed))
 
         return APIResponse.ok({
             'enrolled': enrolled,
@@ -143,9 +143,9 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         })
 
     except ClientError as e:
-        logger.error(f"DynamoDB error: {str(e)}")
+        logger.error("DynamoDB error: %s", e)
         return APIResponse.internal_error('Failed to enroll student')
 
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         return APIResponse.internal_error('An unexpected error occurred')
@@ -8,10 +8,10 @@ import logging
 import os
 from typing import Any, Dict, List
 
-import boto3
 from botocore.exceptions import ClientError
 
 from student.shared.model.StudentCoursesModel import StudentCourseModel
+from utils import aws_utils
 from utils.api_response import APIResponse
 from utils.auth_utils import extract_user_context, is_admin, is_instructor
 from utils.request_utils import extract_query_parameter
@@ -24,9 +24,14 @@ logger.setLevel(logging.INFO)
 STUDENT_COURSES_TABLE_NAME = os.environ.get('STUDENT_COURSES_TABLE_NAME')
 
 # Initialize DynamoDB resource
-dynamodb = boto3.resource('dynamodb')
+dynamodb = aws_utils.get_dynamodb_resource(read_only=True)
 student_courses_table = dynamodb.Table(STUDENT_COURSES_TABLE_NAME)
 
+# Query expressions (built once per execution environment)
+SCHEDULE_ID_INDEX = 'schedule-id-index'
+USER_KEY_CONDITION = 'user_id = :user_id'
+SCHEDULE_KEY_CONDITION = 'schedule_id = :schedule_id'
+
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -37,6 +42,9 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     - Instructors: Can query courses by schedule_id to see enrolled students
     - Admins: Can view any student's courses
 
+    Admins and instructors may pass count=1 with schedule_id to get only the
+    number of enrolled students.
+
     Args:
         event: API Gateway event containing request context with Cognito authorizer claims
         context: Lambda context object
@@ -50,10 +58,17 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         requesting_user_id = user_context['user_id']
         user_groups = user_context['groups']
 
-        logger.info(f"User {requesting_user_id} with roles {user_groups} requesting courses")
+        logger.info("User %s with roles %s requesting courses", requesting_user_id, user_groups)
 
         # Get query parameters
         schedule_id = extract_query_parameter(event, 'schedule_id')
+        count_only = extract_query_parameter(event, 'count') == '1'
+
+        # Count-only roster lookups (e.g. dashboard badges) skip item materialization
+        if schedule_id and count_only and (is_admin(event) or is_instructor(event)):
+            enrolled_count = _count_courses_by_schedule(schedule_id)
+            logger.info("Schedule %s has %s enrollments", schedule_id, enrolled_count)
+            return APIResponse.ok({'schedule_id': schedule_id, 'count': enrolled_count})
 
         # Determine query based on role
         courses = []
@@ -78,7 +93,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             # Students can only view their own courses
             courses = _query_courses_by_user_id(requesting_user_id)
 
-        logger.info(f"Successfully retrieved {len(courses)} courses")
+        logger.info("Successfully retrieved %s courses", len(courses))
 
         # Convert courses to dict format
         courses_data = [course.to_dict() for course in courses]
@@ -86,15 +101,15 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         return APIResponse.ok({'courses': courses_data})
 
     except KeyError as e:
-        logger.error(f"Missing required field in event: {str(e)}")
+        logger.error("Missing required field in event: %s", e)
         return APIResponse.bad_request('Invalid request: missing authorization claims')
 
     except ClientError as e:
-        logger.error(f"DynamoDB error: {str(e)}")
+        logger.error("DynamoDB error: %s", e)
         return APIResponse.internal_error('Failed to fetch courses')
 
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         return APIResponse.internal_error('An unexpected error occurred')
 
 
@@ -110,7 +125,7 @@ def _query_courses_by_user_id(user_id: str) -> List[StudentCourseModel]:
     """
     try:
         response = student_courses_table.query(
-            KeyConditionExpression='user_id = :user_id',
+            KeyConditionExpression=USER_KEY_CONDITION,
             ExpressionAttributeValues={
                 ':user_id': user_id
             }
@@ -119,11 +134,11 @@ def _query_courses_by_user_id(user_id: str) -> List[StudentCourseModel]:
         items = response.get('Items', [])
         courses = [StudentCourseModel.from_dynamodb_item(item) for item in items]
 
-        logger.info(f"Found {len(courses)} courses for user {user_id}")
+        logger.info("Found %s courses for user %s", len(courses), user_id)
         return courses
 
     except ClientError as e:
-        logger.error(f"Error querying courses by user_id: {str(e)}")
+        logger.error("Error querying courses by user_id: %s", e)
         raise
 
 
@@ -139,8 +154,8 @@ def _query_courses_by_schedule(schedule_id: str) -> List[StudentCourseModel]:
     """
     try:
         response = student_courses_table.query(
-            IndexName='schedule-id-index',
-            KeyConditionExpression='schedule_id = :schedule_id',
+            IndexName=SCHEDULE_ID_INDEX,
+            KeyConditionExpression=SCHEDULE_KEY_CONDITION,
             ExpressionAttributeValues={
                 ':schedule_id': schedule_id
             }
@@ -149,9 +164,44 @@ def _query_courses_by_schedule(schedule_id: str) -> List[StudentCourseModel]:
         items = response.get('Items', [])
         courses = [StudentCourseModel.from_dynamodb_item(item) for item in items]
 
-        logger.info(f"Found {len(courses)} courses for schedule {schedule_id}")
+        logger.info("Found %s courses for schedule %s", len(courses), schedule_id)
         return courses
 
     except ClientError as e:
-        logger.error(f"Error querying courses by schedule_id: {str(e)}")
+        logger.error("Error querying courses by schedule_id: %s", e)
+        raise
+
+
+def _count_courses_by_schedule(schedule_id: str) -> int:
+    """
+    Count enrollments for a schedule_id using GSI without fetching items.
+
+    Args:
+        schedule_id: The schedule ID
+
+    Returns:
+        Number of enrollments for the schedule
+    """
+    try:
+        query_params = {
+            'IndexName': SCHEDULE_ID_INDEX,
+            'KeyConditionExpression': SCHEDULE_KEY_CONDITION,
+            'ExpressionAttributeValues': {
+                ':schedule_id': schedule_id
+            },
+            'Select': 'COUNT'
+        }
+
+        total = 0
+        while True:
+            response = student_courses_table.query(**query_params)
+            total += response.get('Count', 0)
+
+            last_evaluated_key = response.get('LastEvaluatedKey')
+            if not last_evaluated_key:
+                return total
+            query_params['ExclusiveStartKey'] = last_evaluated_key
+
+    except ClientError as e:
+        logger.error("Error counting courses by schedule_id: %s", e)
         raise
@@ -8,10 +8,10 @@ import logging
 import os
 from typing import Any, Dict
 
-import boto3
 from botocore.exceptions import ClientError
 
 from student.shared.model.StudentCoursesModel import StudentCourseModel
+from utils import aws_utils
 from utils.api_response import APIResponse
 from utils.auth_utils import require_role, UserRole, AuthorizationError, create_forbidden_response
 from utils.request_utils import extract_path_parameter
@@ -24,9 +24,12 @@ logger.setLevel(logging.INFO)
 STUDENT_COURSES_TABLE_NAME = os.environ.get('STUDENT_COURSES_TABLE_NAME')
 
 # Initialize DynamoDB resource
-dynamodb = boto3.resource('dynamodb')
+dynamodb = aws_utils.get_dynamodb_resource(read_only=True)
 student_courses_table = dynamodb.Table(STUDENT_COURSES_TABLE_NAME)
 
+# Query expressions (built once per execution environment)
+USER_KEY_CONDITION = 'user_id = :user_id'
+
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -44,9 +47,9 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         # Check authorization - only Admin can view student enrollments
         try:
             user_context = require_role(event, [UserRole.ADMIN])
-            logger.info(f"User {user_context['user_id']} authorized as Admin for get student enrollments")
+            logger.info("User %s authorized as Admin for get student enrollments", user_context['user_id'])
         except AuthorizationError as e:
-            logger.warning(f"Authorization failed: {str(e)}")
+            logger.warning("Authorization failed: %s", e)
             return create_forbidden_response()
 
         # Extract path parameters
@@ -54,11 +57,11 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         if error:
             return error
 
-        logger.info(f"Fetching enrollments for student: {user_id}")
+        logger.info("Fetching enrollments for student: %s", user_id)
 
         # Query student_courses table by user_id (PK)
         response = student_courses_table.query(
-            KeyConditionExpression='user_id = :user_id',
+            KeyConditionExpression=USER_KEY_CONDITION,
             ExpressionAttributeValues={
                 ':user_id': user_id
             }
@@ -71,18 +74,18 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 enrollment = StudentCourseModel.from_dynamodb_item(item)
                 enrollments.append(enrollment.to_dict())
             except Exception as e:
-                logger.error(f"Error parsing enrollment item: {str(e)}")
+                logger.error("Error parsing enrollment item: %s", e)
                 # Skip malformed items but continue processing
                 continue
 
-        logger.info(f"Successfully retrieved {len(enrollments)} enrollments for student {user_id}")
+        logger.info("Successfully retrieved %s enrollments for student %s", len(enrollments), user_id)
 
         return APIResponse.ok({'enrollments': enrollments})
 
     except ClientError as e:
-        logger.error(f"DynamoDB error: {str(e)}")
+        logger.error("DynamoDB error: %s", e)
         return APIResponse.internal_error('Failed to fetch enrollments')
 
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         return APIResponse.internal_error('An unexpected error occurred')
@@ -6,14 +6,17 @@ Admin-only endpoint to list all students with pagination support.
 
 import logging
 import os
-from typing import Any, Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
-import boto3
 from botocore.exceptions import ClientError
 
-from student.shared.model.StudentModel import StudentModel
+from student.shared.model.StudentModel import StudentModel, DEFAULT_TENANT
+from utils import aws_utils
 from utils.api_response import APIResponse
 from utils.auth_utils import require_role, UserRole, AuthorizationError, create_forbidden_response
+from utils.pagination_utils import decode_last_evaluated_key, parse_page_size, build_pagination_response
 from utils.request_utils import extract_query_parameter
 
 # Configure logging
@@ -24,18 +27,33 @@ logger.setLevel(logging.INFO)
 STUDENTS_TABLE_NAME = os.environ.get('STUDENTS_TABLE_NAME')
 
 # Initialize DynamoDB resource
-dynamodb = boto3.resource('dynamodb')
+dynamodb = aws_utils.get_dynamodb_resource(read_only=True)
 students_table = dynamodb.Table(STUDENTS_TABLE_NAME)
 
+# Low-level client for the parallel export scan; unlike resources it is thread-safe
+dynamodb_client = aws_utils.get_dynamodb_read_client()
+
 # Constants
 DEFAULT_PAGE_SIZE = 20
 MAX_PAGE_SIZE = 100
+EXPORT_SCAN_SEGMENTS = 4
+# Upper bound on students returned by export=true, keeping the response well
+# under Lambda's 6 MB response payload limit
+MAX_EXPORT_ITEMS = 5000
+
+# Name-ordered GSI (PK: tenant, SK: last_name_lc#first_name_lc#user_id)
+TENANT_NAME_INDEX = 'by-tenant-name'
+TENANT_KEY_CONDITION = 'tenant = :tenant'
 
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Lambda handler to list all students with pagination support.
 
+    Passing export=true returns every student in a single response, fetched
+    with a parallel scan instead of page by page. Exports larger than
+    MAX_EXPORT_ITEMS are rejected in favour of the paginated listing.
+
     Args:
         event: API Gateway event containing query parameters and request context
         context: Lambda context object
@@ -47,17 +65,15 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         # Check authorization - only Admin can list students
         try:
             user_context = require_role(event, [UserRole.ADMIN])
-            logger.info(f"User {user_context['user_id']} authorized as Admin for list students")
+            logger.info("User %s authorized as Admin for list students", user_context['user_id'])
         except AuthorizationError as e:
-            logger.warning(f"Authorization failed: {str(e)}")
+            logger.warning("Authorization failed: %s", e)
             return create_forbidden_response()
 
-        # Import pagination utilities
-        from utils.pagination_utils import decode_last_evaluated_key, parse_page_size, build_pagination_response
-
         # Extract query parameters
         page_size_str = extract_query_parameter(event, 'page_size')
         last_key_param = extract_query_parameter(event, 'last_key')
+        export_all = extract_query_parameter(event, 'export') == 'true'
 
         # Parse page size
         page_size = parse_page_size(page_size_str, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
@@ -65,50 +81,123 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         # Decode pagination key
         exclusive_start_key = decode_last_evaluated_key(last_key_param)
 
-        logger.info(f"Listing students with page_size: {page_size}, has_last_key: {bool(exclusive_start_key)}")
-
-        # Scan DynamoDB table with pagination
-        scan_params = {'Limit': page_size}
-        if exclusive_start_key:
-            scan_params['ExclusiveStartKey'] = exclusive_start_key
-
-        response = students_table.scan(**scan_params)
+        if export_all:
+            logger.info("Exporting all students with %s scan segments", EXPORT_SCAN_SEGMENTS)
+            items = _parallel_scan_students()
+            last_evaluated_key = None
+
+            if items is None:
+                logger.warning("Export exceeds %s students, rejecting", MAX_EXPORT_ITEMS)
+                return APIResponse.bad_request(
+                    f'Too many students to export at once (limit {MAX_EXPORT_ITEMS}); use paginated listing instead'
+                )
+
+            # Sort students by last_name for consistent ordering
+            items.sort(key=_student_sort_key)
+        else:
+            logger.info("Listing students with page_size: %s, has_last_key: %s", page_size, bool(exclusive_start_key))
+
+            # Query the name-ordered GSI; results come back sorted by last/first name
+            query_params = {
+                'IndexName': TENANT_NAME_INDEX,
+                'KeyConditionExpression': TENANT_KEY_CONDITION,
+                'ExpressionAttributeValues': {
+                    ':tenant': DEFAULT_TENANT
+                },
+                'ScanIndexForward': True,
+                'Limit': page_size
+            }
+            if exclusive_start_key:
+                query_params['ExclusiveStartKey'] = exclusive_start_key
+
+            response = students_table.query(**query_params)
+            items = response.get('Items', [])
+            last_evaluated_key = response.get('LastEvaluatedKey')
 
         # Parse items to StudentModel
         students = []
-        for item in response.get('Items', []):
+        for item in items:
             try:
                 student = StudentModel.from_dynamodb_item(item)
                 students.append(student.to_dict())
             except Exception as e:
-                logger.error(f"Error parsing student item: {str(e)}")
+                logger.error("Error parsing student item: %s", e)
                 continue
 
-        # Sort students by last_name for consistent ordering
-        students.sort(key=lambda x: (x.get('last_name', '').lower(), x.get('first_name', '').lower()))
-
-        # Build pagination response
-        pagination_data = build_pagination_response(
+        # Build pagination response under the 'students' key for API consistency
+        response_data = build_pagination_response(
             items=students,
-            last_evaluated_key=response.get('LastEvaluatedKey')
+            last_evaluated_key=last_evaluated_key,
+            items_key='students'
         )
 
-        # Rename 'items' to 'students' for API consistency
-        response_data = {
-            'students': pagination_data['items'],
-            'count': pagination_data['count'],
-            'has_more': pagination_data['has_more']
-        }
-        if 'last_evaluated_key' in pagination_data:
-            response_data['last_evaluated_key'] = pagination_data['last_evaluated_key']
-
-        logger.info(f"Successfully retrieved {len(students)} students")
+        logger.info("Successfully retrieved %s students", len(students))
         return APIResponse.ok(response_data)
 
     except ClientError as e:
-        logger.error(f"DynamoDB error: {str(e)}")
+        logger.error("DynamoDB error: %s", e)
         return APIResponse.internal_error('Failed to list students')
 
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         return APIResponse.internal_error('An unexpected error occurred')
+
+
+def _student_sort_key(item: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Build the (last_name, first_name) sort key for a raw student item.
+
+    Uses the pre-lowercased name columns written at profile creation and only
+    falls back to lowercasing for items written before those columns existed.
+    """
+    return (
+        item.get('last_name_lc') or item.get('last_name', '').lower(),
+        item.get('first_name_lc') or item.get('first_name', '').lower(),
+    )
+
+
+def _parallel_scan_students() -> Optional[List[Dict[str, Any]]]:
+    """
+    Scan the entire students table using parallel segments.
+
+    Each segment is scanned in its own worker thread through the low-level
+    client, which is thread-safe (boto3 resources are not). All segments stop
+    as soon as their combined count passes MAX_EXPORT_ITEMS, since the export
+    is rejected at that point anyway.
+
+    Returns:
+        List of student items from all segments, converted to plain dicts,
+        or None if the table holds more than MAX_EXPORT_ITEMS students
+    """
+    lock = threading.Lock()
+    limit_reached = threading.Event()
+    total_items = 0
+
+    def scan_segment(segment: int) -> List[Dict[str, Any]]:
+        nonlocal total_items
+        scan_params = {'TableName': STUDENTS_TABLE_NAME, 'Segment': segment, 'TotalSegments': EXPORT_SCAN_SEGMENTS}
+        segment_items = []
+
+        while not limit_reached.is_set():
+            response = dynamodb_client.scan(**scan_params)
+            page_items = response.get('Items', [])
+            segment_items.extend(page_items)
+
+            with lock:
+                total_items += len(page_items)
+                if total_items > MAX_EXPORT_ITEMS:
+                    limit_reached.set()
+
+            last_evaluated_key = response.get('LastEvaluatedKey')
+            if not last_evaluated_key:
+                break
+            scan_params['ExclusiveStartKey'] = last_evaluated_key
+
+        return segment_items
+
+    with ThreadPoolExecutor(max_workers=EXPORT_SCAN_SEGMENTS) as executor:
+        segments = list(executor.map(scan_segment, range(EXPORT_SCAN_SEGMENTS)))
+
+    if limit_reached.is_set():
+        return None
+    return [aws_utils.deserialize_item(item) for segment_items in segments for item in segment_items]
@@ -2,7 +2,8 @@
 Create Student Profile Lambda Handler
 
 Automatically triggered by Cognito PostConfirmation to create
-student profile and subscribe to notifications.
+student profile. Notification subscription and group assignment are
+handed off to post_signup_side_effects via an async invocation.
 """
 
 import logging
@@ -10,33 +11,60 @@ import os
 from datetime import datetime, timezone
 from typing import Any, Dict
 
-import boto3
+import orjson
 from botocore.exceptions import ClientError
 
 from student.shared.model.StudentModel import StudentModel
 from utils import aws_utils
-from utils.sns_utils import subscribe_user_to_notifications
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-dynamodb = aws_utils.get_dynamodb_resource()
+# Low-level DynamoDB client (avoids loading the boto3 resource model on cold start) and
+# Lambda client for dispatching side effects, built concurrently during cold start
+dynamodb_client, lambda_client = aws_utils.get_clients_in_parallel('dynamodb', 'lambda')
 table_name = os.environ.get('STUDENTS_TABLE_NAME', 'students')
-students_table = dynamodb.Table(table_name)
 
-# SNS topic ARN for attendance notifications
-SNS_TOPIC_ARN = os.environ.get('SNS_TOPIC_ARN')
+# Lambda that subscribes the student to notifications and assigns the Student group
+POST_SIGNUP_FUNCTION_NAME = os.environ.get('POST_SIGNUP_FUNCTION_NAME')
 
-# Cognito client for group assignment
-cognito_client = boto3.client('cognito-idp')
+
+def _dispatch_side_effects(user_id: str, email: str, user_pool_id: str) -> None:
+    """
+    Invoke the post-signup side effects Lambda asynchronously.
+
+    Args:
+        user_id: Cognito user ID (sub) of the student
+        email: Student's email address
+        user_pool_id: ID of the user pool the user signed up in
+    """
+    if not POST_SIGNUP_FUNCTION_NAME:
+        logger.warning("Post-signup function not configured, skipping side effects")
+        return
+
+    try:
+        lambda_client.invoke(
+            FunctionName=POST_SIGNUP_FUNCTION_NAME,
+            InvocationType='Event',
+            Payload=orjson.dumps({
+                'user_id': user_id,
+                'email': email,
+                'user_pool_id': user_pool_id,
+            })
+        )
+        logger.info("Dispatched post-signup side effects for user_id: %s", user_id)
+    except Exception as e:
+        logger.error("Failed to dispatch post-signup side effects: %s", e)
+        # Continue even if dispatch fails
 
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Cognito PostConfirmation trigger handler.
 
-    Creates student profile, subscribes to notifications, and assigns to Student group.
+    Creates student profile, then asynchronously triggers notification
+    subscription and Student group assignment.
 
     Note: This is a Cognito trigger, not an API Gateway handler, so it returns
     the event object directly rather than an API Gateway response.
@@ -47,7 +75,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         user_pool_id = event.get('userPoolId')
 
         if trigger_source != 'PostConfirmation_ConfirmSignUp':
-            logger.info(f"Skipping non-signup trigger: {trigger_source}")
+            logger.info("Skipping non-signup trigger: %s", trigger_source)
             return event
 
         user_id = user_attributes.get('sub')
@@ -60,22 +88,6 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
 
         current_time = datetime.now(timezone.utc)
 
-        # Subscribe user to SNS notification topic
-        subscription_arn = None
-
-        if SNS_TOPIC_ARN:
-            try:
-                subscription_arn = subscribe_user_to_notifications(
-                    topic_arn=SNS_TOPIC_ARN,
-                    user_email=email
-                )
-                logger.info(f"Successfully subscribed {email} to SNS topic. ARN: {subscription_arn}")
-            except Exception as e:
-                logger.error(f"Failed to subscribe to SNS topic: {str(e)}")
-                # Continue with profile creation even if SNS subscription fails
-        else:
-            logger.warning("SNS topic ARN not configured, skipping subscription")
-
         student = StudentModel(
             user_id=user_id,
             student_id=None,
@@ -86,36 +98,35 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             face_registered=False,
             face_s3_key=None,
             face_registered_at=None,
-            sns_subscription_arn=subscription_arn,
+            sns_subscription_arn=None,
             created_at=current_time,
             updated_at=current_time,
         )
-        students_table.put_item(Item=student.to_dynamodb_item())
-        logger.info(f"Successfully created student record for user_id: {user_id}, email: {email}")
-
-        # Assign user to Student group in Cognito
-        if user_pool_id:
-            try:
-                cognito_client.admin_add_user_to_group(
-                    UserPoolId=user_pool_id,
-                    Username=user_id,
-                    GroupName='Student'
-                )
-                logger.info(f"Successfully added user {user_id} to Student group")
-            except Exception as e:
-                logger.error(f"Failed to add user to Student group: {str(e)}")
-                # Continue even if group assignment fails
-        else:
-            logger.warning("UserPoolId not found in event, skipping group assignment")
+        # PostConfirmation can be delivered more than once; never overwrite an existing record
+        dynamodb_client.put_item(
+            TableName=table_name,
+            Item=aws_utils.serialize_item(student.to_dynamodb_item()),
+            ConditionExpression='attribute_not_exists(user_id)'
+        )
+        logger.info("Successfully created student record for user_id: %s, email: %s", user_id, email)
+
+        # Subscription ARN is written back to the record by the side effects Lambda
+        _dispatch_side_effects(user_id, email, user_pool_id)
 
     except ClientError as e:
         error_code = e.response['Error']['Code']
         error_message = e.response['Error']['Message']
-        logger.error(f"DynamoDB ClientError: {error_code} - {error_message}")
+        if error_code == 'ConditionalCheckFailedException':
+            # A redelivery may follow a run whose dispatch failed; both side effects
+            # are idempotent, so dispatch again rather than leave the user groupless
+            logger.info("Student record already exists for user_id: %s, re-dispatching side effects", user_id)
+            _dispatch_side_effects(user_id, email, user_pool_id)
+            return event
+        logger.error("DynamoDB ClientError: %s - %s", error_code, error_message)
         logger.warning("Failed to create student record, but allowing sign-up to proceed")
 
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         logger.warning("Failed to create student record, but allowing sign-up to proceed")
 
     return event
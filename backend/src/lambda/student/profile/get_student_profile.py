@@ -6,12 +6,11 @@ Retrieves student profile information for the authenticated user.
 
 import logging
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-import boto3
 from botocore.exceptions import ClientError
 
-from student.shared.model.StudentModel import StudentModel
+from utils import aws_utils
 from utils.api_response import APIResponse
 
 # Configure logging
@@ -21,9 +20,25 @@ logger.setLevel(logging.INFO)
 # Environment variables
 STUDENTS_TABLE_NAME = os.environ.get('STUDENTS_TABLE_NAME')
 
-# Initialize DynamoDB resource
-dynamodb = boto3.resource('dynamodb')
-students_table = dynamodb.Table(STUDENTS_TABLE_NAME)
+# Low-level DynamoDB client: the read path unwraps attribute values directly
+# instead of going through the resource layer's TypeDeserializer
+dynamodb_client = aws_utils.get_dynamodb_read_client()
+
+# Only the attributes exposed in the profile response
+PROFILE_FIELDS = (
+    'student_id', 'first_name', 'last_name', 'email',
+    'phone_number', 'face_registered', 'face_registered_at',
+)
+PROFILE_PROJECTION = ', '.join(PROFILE_FIELDS)
+
+
+def _unwrap(attribute: Optional[Dict[str, Any]]) -> Any:
+    """Return the Python value of a string/boolean/null DynamoDB attribute."""
+    if not attribute or 'NULL' in attribute:
+        return None
+    if 'S' in attribute:
+        return attribute['S']
+    return attribute.get('BOOL')
 
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -40,42 +55,39 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     try:
         # Extract user_id from Cognito authorizer claims
         user_id = event['requestContext']['authorizer']['claims']['sub']
-        logger.info(f"Fetching profile for user_id: {user_id}")
+        logger.info("Fetching profile for user_id: %s", user_id)
 
         # Query DynamoDB for student record
-        response = students_table.get_item(Key={'user_id': user_id})
+        response = dynamodb_client.get_item(
+            TableName=STUDENTS_TABLE_NAME,
+            Key={'user_id': {'S': user_id}},
+            ProjectionExpression=PROFILE_PROJECTION,
+            ConsistentRead=False,
+            ReturnConsumedCapacity='NONE'
+        )
 
         # Check if student exists
         if 'Item' not in response:
-            logger.warning(f"Student profile not found for user_id: {user_id}")
+            logger.warning("Student profile not found for user_id: %s", user_id)
             return APIResponse.not_found('Student profile not found', resource_type='Student')
 
-        # Parse DynamoDB item to StudentModel
+        # Build sanitized response straight from the projected attributes
+        # (timestamps are already stored as ISO 8601 strings)
         student_item = response['Item']
-        student = StudentModel.from_dynamodb_item(student_item)
-
-        # Prepare sanitized response (exclude internal fields)
-        profile_data = {
-            'student_id': student.student_id,
-            'first_name': student.first_name,
-            'last_name': student.last_name,
-            'email': student.email,
-            'phone_number': student.phone_number,
-            'face_registered': student.face_registered,
-            'face_registered_at': student.face_registered_at.isoformat() if student.face_registered_at else None,
-        }
-
-        logger.info(f"Successfully retrieved profile for user_id: {user_id}")
+        profile_data = {field: _unwrap(student_item.get(field)) for field in PROFILE_FIELDS}
+        profile_data['face_registered'] = bool(profile_data['face_registered'])
+
+        logger.info("Successfully retrieved profile for user_id: %s", user_id)
         return APIResponse.ok(profile_data)
 
     except KeyError as e:
-        logger.error(f"Missing required field in event: {str(e)}")
+        logger.error("Missing required field in event: %s", e)
         return APIResponse.bad_request('Invalid request: missing authorization claims')
 
     except ClientError as e:
-        logger.error(f"DynamoDB error: {str(e)}")
+        logger.error("DynamoDB error: %s", e)
         return APIResponse.internal_error('Failed to fetch student profile')
 
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         return APIResponse.internal_error('An unexpected error occurred')
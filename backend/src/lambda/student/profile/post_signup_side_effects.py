@@ -0,0 +1,103 @@
+"""
+Post Signup Side Effects Lambda Handler
+
+Invoked asynchronously by create_student_profile after the student record
+is written. Subscribes the student to attendance notifications and assigns
+them to the Student group in Cognito, keeping both calls off the
+PostConfirmation critical path.
+"""
+
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+from utils import aws_utils
+from utils.sns_utils import subscribe_user_to_notifications
+
+# Configure logging
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# Low-level DynamoDB client (avoids loading the boto3 resource model on cold start) and
+# Cognito client for group assignment, built concurrently during cold start
+dynamodb_client, cognito_client = aws_utils.get_clients_in_parallel('dynamodb', 'cognito-idp')
+table_name = os.environ.get('STUDENTS_TABLE_NAME', 'students')
+
+# SNS topic ARN for attendance notifications
+SNS_TOPIC_ARN = os.environ.get('SNS_TOPIC_ARN')
+
+
+def _subscribe_to_notifications(user_id: str, email: str) -> None:
+    """
+    Subscribe the student to the notification topic and record the subscription ARN.
+
+    Args:
+        user_id: Cognito user ID (sub) of the student
+        email: Student's email address
+    """
+    if not SNS_TOPIC_ARN:
+        logger.warning("SNS topic ARN not configured, skipping subscription")
+        return
+
+    try:
+        subscription_arn = subscribe_user_to_notifications(
+            topic_arn=SNS_TOPIC_ARN,
+            user_email=email
+        )
+        logger.info("Successfully subscribed %s to SNS topic. ARN: %s", email, subscription_arn)
+
+        dynamodb_client.update_item(
+            TableName=table_name,
+            Key={'user_id': {'S': user_id}},
+            UpdateExpression='SET sns_subscription_arn = :arn, updated_at = :ua',
+            ExpressionAttributeValues={
+                ':arn': {'S': subscription_arn},
+                ':ua': {'S': datetime.now(timezone.utc).isoformat()},
+            }
+        )
+    except Exception as e:
+        logger.error("Failed to subscribe to SNS topic: %s", e)
+
+
+def _add_to_student_group(user_id: str, user_pool_id: str) -> None:
+    """
+    Assign the user to the Student group in Cognito.
+
+    Args:
+        user_id: Cognito user ID (sub) of the student
+        user_pool_id: ID of the user pool the user signed up in
+    """
+    if not user_pool_id:
+        logger.warning("UserPoolId not provided, skipping group assignment")
+        return
+
+    try:
+        cognito_client.admin_add_user_to_group(
+            UserPoolId=user_pool_id,
+            Username=user_id,
+            GroupName='Student'
+        )
+        logger.info("Successfully added user %s to Student group", user_id)
+    except Exception as e:
+        logger.error("Failed to add user to Student group: %s", e)
+
+
+def handler(event: Dict[str, Any], context: Any) -> None:
+    """
+    Async handler for post-signup side effects.
+
+    Args:
+        event: Payload with user_id, email and user_pool_id
+        context: Lambda context object
+    """
+    user_id = event.get('user_id')
+    email = event.get('email')
+    user_pool_id = event.get('user_pool_id')
+
+    if not user_id or not email:
+        logger.error("Missing required fields: user_id=%s, email=%s", user_id, email)
+        return
+
+    _subscribe_to_notifications(user_id, email)
+    _add_to_student_group(user_id, user_pool_id)
@@ -7,14 +7,13 @@ student_id (one-time only) and phone_number.
 
 import logging
 import os
-import re
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
-import boto3
 from botocore.exceptions import ClientError
 
-from student.shared.model.StudentModel import StudentModel
+from student.shared.model.StudentModel import is_valid_phone_number
+from utils import aws_utils
 from utils.api_response import APIResponse
 from utils.request_utils import parse_json_body
 
@@ -25,27 +24,45 @@ logger.setLevel(logging.INFO)
 # Environment variables
 STUDENTS_TABLE_NAME = os.environ.get('STUDENTS_TABLE_NAME')
 
-# Initialize DynamoDB resource
-dynamodb = boto3.resource('dynamodb')
-students_table = dynamodb.Table(STUDENTS_TABLE_NAME)
-
-# Phone number validation regex (10-15 digits, optional + prefix)
-PHONE_NUMBER_PATTERN = re.compile(r'^\+?\d{10,15}$')
-
-
-def validate_phone_number(phone_number: str) -> bool:
-    """
-    Validate phone number format.
-
-    Args:
-        phone_number: Phone number string to validate
-
-    Returns:
-        True if valid, False otherwise
-    """
-    # Remove common formatting characters
-    cleaned = re.sub(r'[\s\-\(\)\.]', '', phone_number)
-    return bool(PHONE_NUMBER_PATTERN.match(cleaned))
+# Low-level DynamoDB client (avoids loading the boto3 resource model on cold start)
+dynamodb_client = aws_utils.get_client_for_resource('dynamodb')
+
+# Attributes returned in the profile response
+PROFILE_FIELDS = (
+    'student_id', 'first_name', 'last_name', 'email',
+    'phone_number', 'face_registered', 'face_registered_at',
+)
+
+# The profile must already exist, and student_id may only be set while it is
+# still missing, null or empty. Both checks run as part of the update itself.
+PROFILE_EXISTS_CONDITION = 'attribute_exists(#uid)'
+STUDENT_ID_UNSET_CONDITION = (
+    PROFILE_EXISTS_CONDITION
+    + ' AND (attribute_not_exists(#sid) OR attribute_type(#sid, :null_type) OR #sid = :empty)'
+)
+# Condition expressions cannot trim, so a whitespace-only stored student_id (also
+# treated as unset) is overwritten by matching its exact value in a second attempt
+BLANK_STUDENT_ID_CONDITION = PROFILE_EXISTS_CONDITION + ' AND #sid = :blank_sid'
+
+# Prebuilt (UpdateExpression, ConditionExpression, ExpressionAttributeNames)
+# keyed by (student_id provided, phone_number provided)
+_UPDATE_SHAPES = {
+    (True, False): (
+        'SET #sid = :sid, #ua = :ua',
+        STUDENT_ID_UNSET_CONDITION,
+        {'#uid': 'user_id', '#sid': 'student_id', '#ua': 'updated_at'},
+    ),
+    (False, True): (
+        'SET #pn = :pn, #ua = :ua',
+        PROFILE_EXISTS_CONDITION,
+        {'#uid': 'user_id', '#pn': 'phone_number', '#ua': 'updated_at'},
+    ),
+    (True, True): (
+        'SET #sid = :sid, #pn = :pn, #ua = :ua',
+        STUDENT_ID_UNSET_CONDITION,
+        {'#uid': 'user_id', '#sid': 'student_id', '#pn': 'phone_number', '#ua': 'updated_at'},
+    ),
+}
 
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -66,7 +83,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     try:
         # Extract user_id from Cognito authorizer claims
         user_id = event['requestContext']['authorizer']['claims']['sub']
-        logger.info(f"Processing profile update for user_id: {user_id}")
+        logger.info("Processing profile update for user_id: %s", user_id)
 
         # Parse and validate request body
         body, error = parse_json_body(event)
@@ -79,100 +96,121 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
 
         # Validate at least one field is provided
         if student_id is None and phone_number is None:
-            logger.warning(f"No fields to update for user_id: {user_id}")
+            logger.warning("No fields to update for user_id: %s", user_id)
             return APIResponse.bad_request(
                 'At least one field (student_id or phone_number) must be provided'
             )
 
         # Validate phone_number format if provided
         if phone_number is not None and phone_number.strip():
-            if not validate_phone_number(phone_number):
-                logger.warning(f"Invalid phone number format for user_id: {user_id}")
+            if not is_valid_phone_number(phone_number):
+                logger.warning("Invalid phone number format for user_id: %s", user_id)
                 return APIResponse.bad_request(
                     'Invalid phone number format. Must contain 10-15 digits and may start with +'
                 )
 
-        # Fetch existing student record
-        get_response = students_table.get_item(Key={'user_id': user_id})
+        # Pick the prebuilt expressions for the fields being updated; only the
+        # values are assembled per call, already in DynamoDB wire format
+        update_expression, condition_expression, expression_attribute_names = _UPDATE_SHAPES[
+            (student_id is not None, phone_number is not None)
+        ]
 
-        if 'Item' not in get_response:
-            logger.warning(f"Student profile not found for user_id: {user_id}")
-            return APIResponse.not_found('Student profile not found', resource_type='Student')
-
-        existing_student = get_response['Item']
-
-        # Check if student_id is being updated when it already exists
-        if student_id is not None:
-            existing_student_id = existing_student.get('student_id')
-            if existing_student_id and existing_student_id.strip():
-                logger.warning(f"Attempt to update existing student_id for user_id: {user_id}")
-                return APIResponse.forbidden('Student ID can only be set once and cannot be changed')
-
-        # Build update expression dynamically
-        update_expressions = []
-        expression_attribute_names = {}
-        expression_attribute_values = {}
+        # Always update updated_at timestamp
+        expression_attribute_values = {':ua': {'S': datetime.now(timezone.utc).isoformat()}}
 
         if student_id is not None:
-            update_expressions.append('#sid = :sid')
-            expression_attribute_names['#sid'] = 'student_id'
-            expression_attribute_values[':sid'] = student_id.strip()
+            expression_attribute_values[':sid'] = {'S': student_id.strip()}
+            expression_attribute_values[':null_type'] = {'S': 'NULL'}
+            expression_attribute_values[':empty'] = {'S': ''}
 
         if phone_number is not None:
             # Allow empty string to clear phone number
-            cleaned_phone = phone_number.strip() if phone_number.strip() else None
-            update_expressions.append('#pn = :pn')
-            expression_attribute_names['#pn'] = 'phone_number'
-            expression_attribute_values[':pn'] = cleaned_phone
-
-        # Always update updated_at timestamp
-        update_expressions.append('#ua = :ua')
-        expression_attribute_names['#ua'] = 'updated_at'
-        expression_attribute_values[':ua'] = datetime.now(timezone.utc).isoformat()
-
-        # Construct update expression
-        update_expression = 'SET ' + ', '.join(update_expressions)
+            cleaned_phone = phone_number.strip()
+            expression_attribute_values[':pn'] = {'S': cleaned_phone} if cleaned_phone else {'NULL': True}
 
         # Perform conditional update
-        update_response = students_table.update_item(
-            Key={'user_id': user_id},
-            UpdateExpression=update_expression,
-            ExpressionAttributeNames=expression_attribute_names,
-            ExpressionAttributeValues=expression_attribute_values,
-            ReturnValues='ALL_NEW'
-        )
-
-        # Parse updated item to StudentModel
-        updated_item = update_response['Attributes']
-        student = StudentModel.from_dynamodb_item(updated_item)
-
-        # Prepare response data (same format as GET endpoint)
-        profile_data = {
-            'student_id': student.student_id,
-            'first_name': student.first_name,
-            'last_name': student.last_name,
-            'email': student.email,
-            'phone_number': student.phone_number,
-            'face_registered': student.face_registered,
-            'face_registered_at': student.face_registered_at.isoformat() if student.face_registered_at else None,
+        update_params = {
+            'TableName': STUDENTS_TABLE_NAME,
+            'Key': {'user_id': {'S': user_id}},
+            'UpdateExpression': update_expression,
+            'ConditionExpression': condition_expression,
+            'ExpressionAttributeNames': expression_attribute_names,
+            'ExpressionAttributeValues': expression_attribute_values,
+            'ReturnValues': 'ALL_NEW',
+            'ReturnValuesOnConditionCheckFailure': 'ALL_OLD'
         }
+        try:
+            update_response = dynamodb_client.update_item(**update_params)
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+            # The old item is only returned when the profile exists, so its
+            # absence means the condition failed on attribute_exists(user_id)
+            if 'Item' not in e.response:
+                logger.warning("Student profile not found for user_id: %s", user_id)
+                return APIResponse.not_found('Student profile not found', resource_type='Student')
+
+            stored_student_id = e.response['Item'].get('student_id', {}).get('S')
+            if stored_student_id and stored_student_id.strip():
+                logger.warning("Attempt to update existing student_id for user_id: %s", user_id)
+                return APIResponse.forbidden('Student ID can only be set once and cannot be changed')
+
+            # Any other stored value means the profile changed between the write and the check
+            update_response = (
+                _update_over_blank_student_id(update_params, stored_student_id)
+                if stored_student_id is not None else None
+            )
+            if update_response is None:
+                logger.warning("Profile changed during update for user_id: %s", user_id)
+                return APIResponse.conflict('Profile update conflict. Please refresh and try again.')
 
-        logger.info(f"Successfully updated profile for user_id: {user_id}")
+        # Project the response straight from the returned attributes (same format as
+        # GET endpoint; timestamps are already stored as ISO 8601 strings)
+        updated_item = aws_utils.deserialize_item(update_response['Attributes'])
+        profile_data = {field: updated_item.get(field) for field in PROFILE_FIELDS}
+        profile_data['face_registered'] = bool(profile_data['face_registered'])
+
+        logger.info("Successfully updated profile for user_id: %s", user_id)
         return APIResponse.ok(profile_data)
 
     except KeyError as e:
-        logger.error(f"Missing required field in event: {str(e)}")
+        logger.error("Missing required field in event: %s", e)
         return APIResponse.bad_request('Invalid request: missing authorization claims')
 
     except ClientError as e:
         error_code = e.response['Error']['Code']
-        logger.error(f"DynamoDB error: {error_code} - {str(e)}")
-
-        if error_code == 'ConditionalCheckFailedException':
-            return APIResponse.conflict('Profile update conflict. Please refresh and try again.')
-
+        logger.error("DynamoDB error: %s - %s", error_code, e)
         return APIResponse.internal_error('Failed to update student profile')
 
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         return APIResponse.internal_error('An unexpected error occurred')
+
+
+def _update_over_blank_student_id(update_params: Dict[str, Any], blank_student_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Repeat a student_id update against a stored value that is only whitespace.
+
+    Args:
+        update_params: update_item arguments of the attempt that failed its condition
+        blank_student_id: Whitespace-only student_id currently stored
+
+    Returns:
+        update_item response, or None if the profile changed since the first attempt
+    """
+    expression_attribute_values = {
+        key: value for key, value in update_params['ExpressionAttributeValues'].items()
+        if key not in (':null_type', ':empty')
+    }
+    expression_attribute_values[':blank_sid'] = {'S': blank_student_id}
+
+    try:
+        return dynamodb_client.update_item(**{
+            **update_params,
+            'ConditionExpression': BLANK_STUDENT_ID_CONDITION,
+            'ExpressionAttributeValues': expression_attribute_values,
+        })
+    except ClientError as e:
+        if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+            raise
+        return None
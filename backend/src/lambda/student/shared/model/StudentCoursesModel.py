@@ -13,12 +13,8 @@ class StudentCourseModel(BaseModel):
     status: str = 'active'
 
     def to_dict(self) -> Dict[str, Any]:
-        data = self.model_dump()
-
-        if self.enrollment_date:
-            data['enrollment_date'] = self.enrollment_date.isoformat()
-
-        return data
+        # The API and DynamoDB representations are identical for enrollments
+        return self.to_dynamodb_item()
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'StudentCourseModel':
@@ -42,10 +38,13 @@ class StudentCourseModel(BaseModel):
     def from_dynamodb_item(cls, item: Dict[str, Any]) -> 'StudentCourseModel':
         data = {**item}
 
-        if 'enrollment_date' in data and isinstance(data['enrollment_date'], str):
-            data['enrollment_date'] = datetime.fromisoformat(data['enrollment_date'])
+        # DynamoDB stores the enrollment date as an ISO 8601 string
+        enrollment_date = data.get('enrollment_date')
+        if enrollment_date:
+            data['enrollment_date'] = datetime.fromisoformat(enrollment_date)
 
-        return cls(**data)
+        # Stored items were validated on write, so skip re-validation on reads
+        return cls.model_construct(**data)
 
     class Config:
         json_encoders = {
@@ -4,6 +4,43 @@ from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, EmailStr, field_validator
 
+# Constant partition for the by-tenant-name GSI so all students can be queried in name order
+DEFAULT_TENANT = 'DEFAULT'
+
+# Datetime fields persisted as ISO 8601 strings
+_TIMESTAMP_FIELDS = ('created_at', 'updated_at', 'face_registered_at')
+
+# Phone number validation regex (10-15 digits, optional + prefix), applied
+# after the common formatting characters are stripped
+PHONE_NUMBER_PATTERN = re.compile(r'^\+?\d{10,15}\Z')
+PHONE_NUMBER_SEPARATORS = re.compile(r'[\s\-().]')
+
+# Upper bound on the raw input, checked before any regex work
+MAX_PHONE_NUMBER_LENGTH = 32
+
+
+def is_valid_phone_number(phone_number: str) -> bool:
+    """
+    Validate phone number format.
+
+    Args:
+        phone_number: Phone number string to validate
+
+    Returns:
+        True if valid, False otherwise
+    """
+    if len(phone_number) > MAX_PHONE_NUMBER_LENGTH:
+        return False
+
+    # Remove common formatting characters
+    cleaned = PHONE_NUMBER_SEPARATORS.sub('', phone_number)
+    return PHONE_NUMBER_PATTERN.match(cleaned) is not None
+
+
+def student_name_sort_key(first_name_lc: str, last_name_lc: str, user_id: str) -> str:
+    """Sort key for the by-tenant-name GSI; the user ID suffix keeps duplicate names unique."""
+    return f"{last_name_lc}#{first_name_lc}#{user_id}"
+
 
 class StudentModel(BaseModel):
     user_id: str
@@ -25,26 +62,27 @@ class StudentModel(BaseModel):
         if v is None:
             return v
 
-        # Remove common separators and spaces
-        cleaned = re.sub(r'[\s\-\(\)\.]', '', v)
-
-        # Check if it's a valid format (10-15 digits, optionally starting with +)
-        if not re.match(r'^\+?\d{10,15}$', cleaned):
+        if not is_valid_phone_number(v):
             raise ValueError('Phone number must contain 10-15 digits and may start with +')
 
         return v
 
     def to_dict(self) -> Dict[str, Any]:
-        data = self.model_dump()
-
-        if self.created_at:
-            data['created_at'] = self.created_at.isoformat()
-        if self.updated_at:
-            data['updated_at'] = self.updated_at.isoformat()
-        if self.face_registered_at:
-            data['face_registered_at'] = self.face_registered_at.isoformat()
-
-        return data
+        # Built directly from attributes rather than model_dump() so each field is read once
+        return {
+            'user_id': self.user_id,
+            'student_id': self.student_id,
+            'first_name': self.first_name,
+            'last_name': self.last_name,
+            'email': self.email,
+            'phone_number': self.phone_number,
+            'face_registered': self.face_registered,
+            'face_s3_key': self.face_s3_key,
+            'face_registered_at': self.face_registered_at.isoformat() if self.face_registered_at else None,
+            'sns_subscription_arn': self.sns_subscription_arn,
+            'created_at': self.created_at.isoformat(),
+            'updated_at': self.updated_at.isoformat(),
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'StudentModel':
@@ -58,11 +96,16 @@ class StudentModel(BaseModel):
         return cls(**data)
 
     def to_dynamodb_item(self) -> Dict[str, Any]:
+        first_name_lc = self.first_name.lower()
+        last_name_lc = self.last_name.lower()
         item = {
             'user_id': self.user_id,
             'student_id': self.student_id,
             'first_name': self.first_name,
             'last_name': self.last_name,
+            # Pre-lowercased copies so listings can sort without per-request lower() calls
+            'first_name_lc': first_name_lc,
+            'last_name_lc': last_name_lc,
             'email': self.email,
             'phone_number': self.phone_number,
             'face_registered': self.face_registered,
@@ -71,6 +114,8 @@ class StudentModel(BaseModel):
             'sns_subscription_arn': self.sns_subscription_arn,
             'created_at': self.created_at.isoformat(),
             'updated_at': self.updated_at.isoformat(),
+            'tenant': DEFAULT_TENANT,
+            'name_sort_key': student_name_sort_key(first_name_lc, last_name_lc, self.user_id),
         }
         return item
 
@@ -78,14 +123,13 @@ class StudentModel(BaseModel):
     def from_dynamodb_item(cls, item: Dict[str, Any]) -> 'StudentModel':
         data = {**item}
 
-        if 'created_at' in data and isinstance(data['created_at'], str):
-            data['created_at'] = datetime.fromisoformat(data['created_at'])
-        if 'updated_at' in data and isinstance(data['updated_at'], str):
-            data['updated_at'] = datetime.fromisoformat(data['updated_at'])
-        if 'face_registered_at' in data and data['face_registered_at'] and isinstance(data['face_registered_at'], str):
-            data['face_registered_at'] = datetime.fromisoformat(data['face_registered_at'])
+        for key in _TIMESTAMP_FIELDS:
+            value = data.get(key)
+            if value:
+                data[key] = datetime.fromisoformat(value)
 
-        return cls(**data)
+        # Stored items were validated on write, so skip re-validation on reads
+        return cls.model_construct(**data)
 
     class Config:
         json_encoders = {
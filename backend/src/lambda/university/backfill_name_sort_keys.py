@@ -0,0 +1,109 @@
+"""
+Backfill University Name Sort Keys Lambda Handler
+
+One-off migration for universities written before the by-tenant-name GSI
+existed. Sets tenant and name_sort_key on every university that lacks them,
+so the row appears in list_universities. Not exposed through API Gateway;
+invoke it directly until it reports no remaining key:
+
+    aws lambda invoke --function-name backfill-university-name-keys \\
+        --payload '{"exclusive_start_key": <last_evaluated_key>}' out.json
+"""
+
+import logging
+import os
+from typing import Any, Dict
+
+from botocore.exceptions import ClientError
+
+from university.shared.model.UniversityModel import DEFAULT_TENANT, university_name_sort_key
+from utils import aws_utils
+
+# Configure logging
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# Environment variables
+UNIVERSITIES_TABLE_NAME = os.environ.get('UNIVERSITIES_TABLE_NAME')
+
+# Initialize DynamoDB resource
+dynamodb = aws_utils.get_dynamodb_resource()
+universities_table = dynamodb.Table(UNIVERSITIES_TABLE_NAME)
+
+# Constants
+MISSING_SORT_KEY_FILTER = 'attribute_not_exists(name_sort_key)'
+# The row must still exist and must not have been re-saved since the scan read it
+BACKFILL_CONDITION = 'attribute_exists(university_id) AND attribute_not_exists(name_sort_key)'
+BACKFILL_UPDATE_EXPRESSION = 'SET tenant = :tenant, name_sort_key = :name_sort_key'
+# Stop scanning with this much time left so the last page's updates can finish
+MIN_REMAINING_MILLIS = 30_000
+
+
+def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Lambda handler to backfill the by-tenant-name GSI keys on universities.
+
+    Args:
+        event: Optional 'exclusive_start_key' returned by a previous invocation
+        context: Lambda context object
+
+    Returns:
+        Number of universities updated and the 'last_evaluated_key' to resume
+        from, which is None once the whole table has been scanned
+    """
+    scan_params = {
+        'FilterExpression': MISSING_SORT_KEY_FILTER,
+        'ProjectionExpression': 'university_id, university_name',
+    }
+    if event.get('exclusive_start_key'):
+        scan_params['ExclusiveStartKey'] = event['exclusive_start_key']
+
+    updated_count = 0
+    last_evaluated_key = None
+
+    while True:
+        response = universities_table.scan(**scan_params)
+
+        for item in response.get('Items', []):
+            if _backfill_university(item):
+                updated_count += 1
+
+        last_evaluated_key = response.get('LastEvaluatedKey')
+        if not last_evaluated_key or context.get_remaining_time_in_millis() < MIN_REMAINING_MILLIS:
+            break
+        scan_params['ExclusiveStartKey'] = last_evaluated_key
+
+    logger.info("Backfilled %s universities, has_more: %s", updated_count, bool(last_evaluated_key))
+    return {
+        'updated_count': updated_count,
+        'last_evaluated_key': last_evaluated_key
+    }
+
+
+def _backfill_university(item: Dict[str, Any]) -> bool:
+    """
+    Set tenant and name_sort_key on a single university.
+
+    Args:
+        item: University item with university_id and university_name
+
+    Returns:
+        True if the item was updated, False if it changed since it was scanned
+    """
+    university_id = item['university_id']
+    try:
+        universities_table.update_item(
+            Key={'university_id': university_id},
+            UpdateExpression=BACKFILL_UPDATE_EXPRESSION,
+            ConditionExpression=BACKFILL_CONDITION,
+            ExpressionAttributeValues={
+                ':tenant': DEFAULT_TENANT,
+                ':name_sort_key': university_name_sort_key(item['university_name'], university_id),
+            }
+        )
+    except ClientError as e:
+        if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+            raise
+        logger.info("University %s changed during backfill, skipping", university_id)
+        return False
+    return True
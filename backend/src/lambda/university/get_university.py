@@ -6,12 +6,17 @@ Retrieves university information by university code.
 
 import logging
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-import boto3
 from botocore.exceptions import ClientError
 
-from university.shared.model.UniversityModel import UniversityModel
+from university.shared.model.UniversityModel import (
+    UniversityModel,
+    PROJECTION_ATTRIBUTE_NAMES,
+    PROJECTION_EXPRESSION,
+    university_id_for_code
+)
+from utils import aws_utils
 from utils.api_response import APIResponse
 from utils.request_utils import extract_path_parameter
 
@@ -23,8 +28,9 @@ logger.setLevel(logging.INFO)
 UNIVERSITIES_TABLE_NAME = os.environ.get('UNIVERSITIES_TABLE_NAME')
 
 # Initialize DynamoDB resource
-dynamodb = boto3.resource('dynamodb')
+dynamodb = aws_utils.get_dynamodb_resource(read_only=True)
 universities_table = dynamodb.Table(UNIVERSITIES_TABLE_NAME)
+aws_utils.warm_table_connection(universities_table)
 
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -43,34 +49,65 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         university_code, error = extract_path_parameter(event, 'university_code')
         if error:
             return error
-        logger.info(f"Fetching university with code: {university_code}")
+        logger.info("Fetching university with code: %s", university_code)
 
-        # Query DynamoDB using GSI (university-code-index)
-        response = universities_table.query(
-            IndexName='university-code-index',
-            KeyConditionExpression='university_code = :code',
-            ExpressionAttributeValues={
-                ':code': university_code.upper()
-            }
-        )
+        # Codes are stored uppercase; clients usually send them that way already
+        if not university_code.isupper():
+            university_code = university_code.upper()
+
+        university_item = _get_university_item(university_code)
 
         # Check if a university exists
-        if not response.get('Items') or len(response['Items']) == 0:
-            logger.warning(f"University not found for code: {university_code}")
+        if not university_item:
+            logger.warning("University not found for code: %s", university_code)
             return APIResponse.not_found(f'University with code {university_code} not found',
                                          resource_type='University')
 
-        # Parse DynamoDB item to UniversityModel
-        university_item = response['Items'][0]
-        university = UniversityModel.from_dynamodb_item(university_item)
+        # Stored items were validated on write, so convert straight to the API shape
+        university = UniversityModel.dynamodb_item_to_api_dict(university_item)
 
-        logger.info(f"Successfully retrieved university: {university_code}")
-        return APIResponse.ok(university.to_dict())
+        logger.info("Successfully retrieved university: %s", university_code)
+        return APIResponse.ok(university)
 
     except ClientError as e:
-        logger.error(f"DynamoDB error: {str(e)}")
+        logger.error("DynamoDB error: %s", e)
         return APIResponse.internal_error('Failed to fetch university')
 
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         return APIResponse.internal_error('An unexpected error occurred')
+
+
+def _get_university_item(university_code: str) -> Optional[Dict[str, Any]]:
+    """
+    Fetch a university item by code.
+
+    Universities upserted with a code-derived ID are read with get_item on the
+    base table. Older universities keep random IDs, so a miss falls back to the
+    university-code-index GSI.
+
+    Args:
+        university_code: Uppercase university code
+
+    Returns:
+        DynamoDB item, or None if no university has the code
+    """
+    response = universities_table.get_item(
+        Key={'university_id': university_id_for_code(university_code)},
+        ProjectionExpression=PROJECTION_EXPRESSION,
+        ExpressionAttributeNames=PROJECTION_ATTRIBUTE_NAMES
+    )
+    if 'Item' in response:
+        return response['Item']
+
+    response = universities_table.query(
+        IndexName='university-code-index',
+        KeyConditionExpression='university_code = :code',
+        ExpressionAttributeValues={
+            ':code': university_code
+        },
+        ProjectionExpression=PROJECTION_EXPRESSION,
+        ExpressionAttributeNames=PROJECTION_ATTRIBUTE_NAMES
+    )
+    items = response.get('Items')
+    return items[0] if items else None
@@ -1,17 +1,25 @@
 """
 List Universities Lambda Handler
 
-Admin-only endpoint to list all universities with pagination support.
+Admin-only endpoint to list all universities with pagination support,
+or to look up a specific set of universities by code.
 """
 
 import logging
 import os
-from typing import Any, Dict
+import time
+from typing import Any, Dict, List
 
-import boto3
 from botocore.exceptions import ClientError
 
-from university.shared.model.UniversityModel import UniversityModel
+from university.shared.model.UniversityModel import (
+    UniversityModel,
+    DEFAULT_TENANT,
+    PROJECTION_ATTRIBUTE_NAMES,
+    PROJECTION_EXPRESSION,
+    university_id_for_code
+)
+from utils import aws_utils
 from utils.api_response import APIResponse
 from utils.auth_utils import require_role, UserRole, AuthorizationError, create_forbidden_response
 from utils.pagination_utils import decode_last_evaluated_key, parse_page_size, build_pagination_response
@@ -25,12 +33,20 @@ logger.setLevel(logging.INFO)
 UNIVERSITIES_TABLE_NAME = os.environ.get('UNIVERSITIES_TABLE_NAME')
 
 # Initialize DynamoDB resource
-dynamodb = boto3.resource('dynamodb')
+dynamodb = aws_utils.get_dynamodb_resource(read_only=True)
 universities_table = dynamodb.Table(UNIVERSITIES_TABLE_NAME)
+aws_utils.warm_table_connection(universities_table)
 
 # Constants
 DEFAULT_PAGE_SIZE = 20
 MAX_PAGE_SIZE = 100
+TENANT_NAME_INDEX = 'by-tenant-name'
+TENANT_KEY_CONDITION = 'tenant = :tenant'
+UNIVERSITY_CODE_INDEX = 'university-code-index'
+UNIVERSITY_CODE_KEY_CONDITION = 'university_code = :code'
+MAX_LOOKUP_CODES = 25
+MAX_BATCH_GET_ATTEMPTS = 3
+BATCH_GET_BACKOFF_SECONDS = 0.05
 
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -48,11 +64,26 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         # Check authorization - only Admin can list universities
         try:
             user_context = require_role(event, [UserRole.ADMIN])
-            logger.info(f"User {user_context['user_id']} authorized as Admin for list universities")
+            logger.info("User %s authorized as Admin for list universities", user_context['user_id'])
         except AuthorizationError as e:
-            logger.warning(f"Authorization failed: {str(e)}")
+            logger.warning("Authorization failed: %s", e)
             return create_forbidden_response()
 
+        # Look up specific universities in one batch request instead of one get_university call each
+        codes_param = extract_query_parameter(event, 'codes')
+        if codes_param:
+            codes = list(dict.fromkeys(code.strip().upper() for code in codes_param.split(',') if code.strip()))
+            if len(codes) > MAX_LOOKUP_CODES:
+                return APIResponse.bad_request(f'At most {MAX_LOOKUP_CODES} codes can be requested at once')
+
+            universities = _get_universities_by_codes(codes)
+            logger.info("Retrieved %s of %s requested universities", len(universities), len(codes))
+            return APIResponse.ok({
+                'universities': universities,
+                'count': len(universities),
+                'has_more': False
+            })
+
         # Extract query parameters
         page_size_str = extract_query_parameter(event, 'page_size')
         last_key_param = extract_query_parameter(event, 'last_key')
@@ -63,50 +94,129 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         # Decode pagination key
         exclusive_start_key = decode_last_evaluated_key(last_key_param)
 
-        logger.info(f"Listing universities with page_size: {page_size}, has_last_key: {bool(exclusive_start_key)}")
-
-        # Scan DynamoDB table with pagination
-        scan_params = {'Limit': page_size}
+        logger.info("Listing universities with page_size: %s, has_last_key: %s", page_size, bool(exclusive_start_key))
+
+        # Query the name-ordered GSI so pages come back already sorted
+        query_params = {
+            'IndexName': TENANT_NAME_INDEX,
+            'KeyConditionExpression': TENANT_KEY_CONDITION,
+            'ExpressionAttributeValues': {
+                ':tenant': DEFAULT_TENANT
+            },
+            'ProjectionExpression': PROJECTION_EXPRESSION,
+            'ExpressionAttributeNames': PROJECTION_ATTRIBUTE_NAMES,
+            'ScanIndexForward': True,
+            'Limit': page_size
+        }
         if exclusive_start_key:
-            scan_params['ExclusiveStartKey'] = exclusive_start_key
-
-        response = universities_table.scan(**scan_params)
-
-        # Parse items to UniversityModel
-        universities = []
-        for item in response.get('Items', []):
-            try:
-                university = UniversityModel.from_dynamodb_item(item)
-                universities.append(university.to_dict())
-            except Exception as e:
-                logger.error(f"Error parsing university item: {str(e)}")
-                continue
+            query_params['ExclusiveStartKey'] = exclusive_start_key
 
-        # Sort universities by university_name for consistent ordering
-        universities.sort(key=lambda x: x.get('university_name', '').lower())
+        response = universities_table.query(**query_params)
 
-        # Build pagination response
-        pagination_data = build_pagination_response(
+        # Convert items to API dicts; fall back to per-item conversion only if
+        # the page contains a malformed item, so bad rows are skipped individually
+        items = response.get('Items', [])
+        try:
+            universities = [UniversityModel.dynamodb_item_to_api_dict(item) for item in items]
+        except Exception:
+            universities = []
+            for item in items:
+                try:
+                    universities.append(UniversityModel.dynamodb_item_to_api_dict(item))
+                except Exception as e:
+                    logger.warning("Skipping unparseable university item: %s", e)
+
+        # Build pagination response under the 'universities' key for API consistency
+        response_data = build_pagination_response(
             items=universities,
-            last_evaluated_key=response.get('LastEvaluatedKey')
+            last_evaluated_key=response.get('LastEvaluatedKey'),
+            items_key='universities'
         )
 
-        # Rename 'items' to 'universities' for API consistency
-        response_data = {
-            'universities': pagination_data['items'],
-            'count': pagination_data['count'],
-            'has_more': pagination_data['has_more']
-        }
-        if 'last_evaluated_key' in pagination_data:
-            response_data['last_evaluated_key'] = pagination_data['last_evaluated_key']
-
-        logger.info(f"Successfully retrieved {len(universities)} universities")
+        logger.info("Successfully retrieved %s universities", len(universities))
         return APIResponse.ok(response_data)
 
     except ClientError as e:
-        logger.error(f"DynamoDB error: {str(e)}")
+        logger.error("DynamoDB error: %s", e)
         return APIResponse.internal_error('Failed to list universities')
 
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         return APIResponse.internal_error('An unexpected error occurred')
+
+
+def _get_universities_by_codes(codes: List[str]) -> List[Dict[str, Any]]:
+    """
+    Fetch universities by code with one BatchGetItem on their code-derived IDs.
+
+    Universities created before IDs were derived from codes (until
+    rekey_universities has moved them) are missed by the batch get; those
+    codes fall back to one university-code-index query each, run
+    sequentially since only legacy rows reach them.
+
+    Args:
+        codes: Uppercase university codes
+
+    Returns:
+        API dicts for the universities found, sorted by name
+    """
+    if not codes:
+        return []
+
+    items = _batch_get_universities([university_id_for_code(code) for code in codes])
+
+    found_codes = {item['university_code'] for item in items}
+    missing_codes = [code for code in codes if code not in found_codes]
+    for code in missing_codes:
+        code_items = _query_university_by_code(code)
+        if code_items:
+            items.append(code_items[0])
+
+    universities = [UniversityModel.dynamodb_item_to_api_dict(item) for item in items]
+    universities.sort(key=lambda university: university['university_name'].lower())
+    return universities
+
+
+def _batch_get_universities(university_ids: List[str]) -> List[Dict[str, Any]]:
+    """
+    Fetch universities by ID with BatchGetItem, retrying unprocessed keys.
+
+    Args:
+        university_ids: At most 100 university IDs
+
+    Returns:
+        DynamoDB items for the IDs that exist
+    """
+    request_items = {
+        UNIVERSITIES_TABLE_NAME: {
+            'Keys': [{'university_id': university_id} for university_id in university_ids],
+            'ProjectionExpression': PROJECTION_EXPRESSION,
+            'ExpressionAttributeNames': PROJECTION_ATTRIBUTE_NAMES,
+        }
+    }
+    items = []
+
+    for attempt in range(MAX_BATCH_GET_ATTEMPTS):
+        if attempt:
+            time.sleep(BATCH_GET_BACKOFF_SECONDS * (2 ** attempt))
+
+        response = dynamodb.batch_get_item(RequestItems=request_items)
+        items.extend(response.get('Responses', {}).get(UNIVERSITIES_TABLE_NAME, []))
+
+        request_items = response.get('UnprocessedKeys')
+        if not request_items:
+            return items
+
+    raise RuntimeError(f'BatchGetItem left keys unprocessed after {MAX_BATCH_GET_ATTEMPTS} attempts')
+
+
+def _query_university_by_code(university_code: str) -> List[Dict[str, Any]]:
+    """Query the university-code-index GSI for one code."""
+    response = universities_table.query(
+        IndexName=UNIVERSITY_CODE_INDEX,
+        KeyConditionExpression=UNIVERSITY_CODE_KEY_CONDITION,
+        ExpressionAttributeValues={':code': university_code},
+        ProjectionExpression=PROJECTION_EXPRESSION,
+        ExpressionAttributeNames=PROJECTION_ATTRIBUTE_NAMES
+    )
+    return response.get('Items', [])
@@ -0,0 +1,138 @@
+"""
+Re-key Universities Lambda Handler
+
+One-off migration for universities created before IDs were derived from
+codes. Moves every university whose university_id is not
+university_id_for_code(university_code) to its code-derived ID, so upserts
+and lookups reach it by primary key. Not exposed through API Gateway; invoke
+it directly until it reports no remaining key:
+
+    aws lambda invoke --function-name rekey-universities \\
+        --payload '{"exclusive_start_key": <last_evaluated_key>}' out.json
+"""
+
+import logging
+import os
+from typing import Any, Dict
+
+from botocore.exceptions import ClientError
+
+from university.shared.model.UniversityModel import (
+    DEFAULT_TENANT,
+    university_id_for_code,
+    university_name_sort_key
+)
+from utils import aws_utils
+
+# Configure logging
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# Environment variables
+UNIVERSITIES_TABLE_NAME = os.environ.get('UNIVERSITIES_TABLE_NAME')
+
+# Low-level client; items are copied between keys in wire format without conversion
+dynamodb_client = aws_utils.get_client_for_resource('dynamodb')
+
+# Constants
+UNIVERSITY_NOT_EXISTS_CONDITION = 'attribute_not_exists(university_id)'
+UNIVERSITY_EXISTS_CONDITION = 'attribute_exists(university_id)'
+# Stop scanning with this much time left so the last page's moves can finish
+MIN_REMAINING_MILLIS = 30_000
+
+
+def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Lambda handler to move legacy universities to code-derived IDs.
+
+    Args:
+        event: Optional 'exclusive_start_key' returned by a previous invocation
+        context: Lambda context object
+
+    Returns:
+        Number of universities re-keyed and the 'last_evaluated_key' to resume
+        from, which is None once the whole table has been scanned
+    """
+    scan_params = {'TableName': UNIVERSITIES_TABLE_NAME}
+    if event.get('exclusive_start_key'):
+        scan_params['ExclusiveStartKey'] = aws_utils.serialize_item(event['exclusive_start_key'])
+
+    rekeyed_count = 0
+    last_evaluated_key = None
+
+    while True:
+        response = dynamodb_client.scan(**scan_params)
+
+        for item in response.get('Items', []):
+            if _rekey_university(item):
+                rekeyed_count += 1
+
+        last_evaluated_key = response.get('LastEvaluatedKey')
+        if not last_evaluated_key or context.get_remaining_time_in_millis() < MIN_REMAINING_MILLIS:
+            break
+        scan_params['ExclusiveStartKey'] = last_evaluated_key
+
+    logger.info("Re-keyed %s universities, has_more: %s", rekeyed_count, bool(last_evaluated_key))
+    return {
+        'rekeyed_count': rekeyed_count,
+        'last_evaluated_key': aws_utils.deserialize_item(last_evaluated_key) if last_evaluated_key else None
+    }
+
+
+def _rekey_university(item: Dict[str, Any]) -> bool:
+    """
+    Move a single university to its code-derived ID.
+
+    The copy and the delete of the old row run in one transaction. If a row
+    already exists under the derived ID (written by an upsert of the same
+    code), that row is kept and only the legacy row is deleted.
+
+    Args:
+        item: University item in DynamoDB wire format
+
+    Returns:
+        True if the item was moved or merged, False if it already had its derived ID
+    """
+    legacy_id = item['university_id']['S']
+    university_id = university_id_for_code(item['university_code']['S'])
+    if legacy_id == university_id:
+        return False
+
+    new_item = {
+        **item,
+        'university_id': {'S': university_id},
+        'tenant': {'S': DEFAULT_TENANT},
+        'name_sort_key': {'S': university_name_sort_key(item['university_name']['S'], university_id)},
+    }
+    try:
+        dynamodb_client.transact_write_items(TransactItems=[
+            {'Put': {
+                'TableName': UNIVERSITIES_TABLE_NAME,
+                'Item': new_item,
+                'ConditionExpression': UNIVERSITY_NOT_EXISTS_CONDITION,
+            }},
+            {'Delete': {
+                'TableName': UNIVERSITIES_TABLE_NAME,
+                'Key': {'university_id': {'S': legacy_id}},
+                'ConditionExpression': UNIVERSITY_EXISTS_CONDITION,
+            }},
+        ])
+        logger.info("Moved university %s from %s to %s", item['university_code']['S'], legacy_id, university_id)
+    except ClientError as e:
+        if e.response['Error']['Code'] != 'TransactionCanceledException':
+            raise
+        put_reason, delete_reason = [
+            reason.get('Code') for reason in e.response.get('CancellationReasons', [{}, {}])
+        ]
+        if delete_reason == 'ConditionalCheckFailed':
+            logger.info("Legacy university %s was already removed, skipping", legacy_id)
+            return False
+        if put_reason != 'ConditionalCheckFailed':
+            raise
+        # The derived row already exists and holds the newer data; drop the duplicate
+        dynamodb_client.delete_item(
+            TableName=UNIVERSITIES_TABLE_NAME,
+            Key={'university_id': {'S': legacy_id}}
+        )
+        logger.info("Removed duplicate legacy university %s (%s)", item['university_code']['S'], legacy_id)
+    return True
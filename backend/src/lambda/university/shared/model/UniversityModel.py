@@ -1,9 +1,92 @@
 import re
+import uuid
 from datetime import datetime
 from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, field_validator
 
+# Constant partition for the by-tenant-name GSI so all universities can be queried in name order
+DEFAULT_TENANT = 'DEFAULT'
+
+# Validation pattern compiled once at import instead of on every validator call
+UNIVERSITY_CODE_PATTERN = re.compile(r'^[A-Z0-9]{2,10}\Z')
+_VALID_STATUSES = frozenset(('active', 'inactive'))
+
+# Namespace for deriving university IDs from codes, so a code maps to a fixed primary key
+UNIVERSITY_ID_NAMESPACE = uuid.UUID('6f1b1c4e-8a52-4d8e-9a0c-3d7f2b9e5a41')
+
+# Projection limited to the model fields (skips the GSI bookkeeping attributes).
+# Every name is aliased because several (status, domain, timezone) are DynamoDB reserved words.
+_MODEL_FIELDS = (
+    'university_id', 'university_code', 'university_name', 'domain', 'status',
+    'address', 'timezone', 'created_at', 'updated_at',
+)
+PROJECTION_ATTRIBUTE_NAMES = {f'#{field}': field for field in _MODEL_FIELDS}
+PROJECTION_EXPRESSION = ', '.join(PROJECTION_ATTRIBUTE_NAMES)
+
+
+def university_id_for_code(university_code: str) -> str:
+    """
+    Derive the university ID from its code.
+
+    Args:
+        university_code: Uppercase university code
+
+    Returns:
+        UUID string that is the same for every lookup or upsert of the code
+    """
+    return str(uuid.uuid5(UNIVERSITY_ID_NAMESPACE, university_code))
+
+
+def _is_valid_domain(domain: str) -> bool:
+    """
+    Check a lowercase domain with plain string operations.
+
+    Equivalent to ``^[a-z0-9]+([-.][a-z0-9]+)*\\.[a-z]{2,}$``: dot-separated
+    alphanumeric labels that may contain single inner hyphens, ending in an
+    alphabetic TLD of at least two characters.
+    """
+    if not domain.isascii():
+        return False
+
+    labels = domain.split('.')
+    if len(labels) < 2:
+        return False
+
+    tld = labels.pop()
+    if len(tld) < 2 or not tld.isalpha():
+        return False
+
+    for label in labels:
+        if (not label or label[0] == '-' or label[-1] == '-' or '--' in label
+                or not label.replace('-', '').isalnum()):
+            return False
+    return True
+
+
+def _check_university_code(v: str) -> str:
+    if not UNIVERSITY_CODE_PATTERN.match(v):
+        raise ValueError('University code must be 2-10 uppercase alphanumeric characters')
+    return v
+
+
+def _check_domain(v: str) -> str:
+    v = v.lower()
+    if not _is_valid_domain(v):
+        raise ValueError('Invalid domain format')
+    return v
+
+
+def _check_status(v: str) -> str:
+    if v not in _VALID_STATUSES:
+        raise ValueError('Status must be either "active" or "inactive"')
+    return v
+
+
+def university_name_sort_key(university_name: str, university_id: str) -> str:
+    """Sort key for the by-tenant-name GSI; the ID suffix keeps duplicate names unique."""
+    return f"{university_name.lower()}#{university_id}"
+
 
 class UniversityModel(BaseModel):
     university_id: str
@@ -20,36 +103,34 @@ class UniversityModel(BaseModel):
     @classmethod
     def validate_university_code(cls, v: str) -> str:
         """Validate university code format (uppercase alphanumeric, 2-10 chars)."""
-        if not re.match(r'^[A-Z0-9]{2,10}$', v):
-            raise ValueError('University code must be 2-10 uppercase alphanumeric characters')
-        return v
+        return _check_university_code(v)
 
     @field_validator('domain')
     @classmethod
     def validate_domain(cls, v: str) -> str:
         """Validate domain format (basic domain validation)."""
-        if not re.match(r'^[a-z0-9]+([\-\.]{1}[a-z0-9]+)*\.[a-z]{2,}$', v.lower()):
-            raise ValueError('Invalid domain format')
-        return v.lower()
+        return _check_domain(v)
 
     @field_validator('status')
     @classmethod
     def validate_status(cls, v: str) -> str:
         """Validate status is either active or inactive."""
-        if v not in ['active', 'inactive']:
-            raise ValueError('Status must be either "active" or "inactive"')
-        return v
+        return _check_status(v)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert model to dictionary with ISO formatted dates."""
-        data = self.model_dump()
-
-        if self.created_at:
-            data['created_at'] = self.created_at.isoformat()
-        if self.updated_at:
-            data['updated_at'] = self.updated_at.isoformat()
-
-        return data
+        # Built directly from attributes rather than model_dump() so each field is read once
+        return {
+            'university_id': self.university_id,
+            'university_code': self.university_code,
+            'university_name': self.university_name,
+            'domain': self.domain,
+            'status': self.status,
+            'address': self.address,
+            'timezone': self.timezone,
+            'created_at': self.created_at.isoformat(),
+            'updated_at': self.updated_at.isoformat(),
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'UniversityModel':
@@ -63,17 +144,10 @@ class UniversityModel(BaseModel):
 
     def to_dynamodb_item(self) -> Dict[str, Any]:
         """Convert model to DynamoDB item format."""
-        item = {
-            'university_id': self.university_id,
-            'university_code': self.university_code,
-            'university_name': self.university_name,
-            'domain': self.domain,
-            'status': self.status,
-            'address': self.address,
-            'timezone': self.timezone,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
-        }
+        # Same shape as the API dict plus the by-tenant-name GSI keys
+        item = self.to_dict()
+        item['tenant'] = DEFAULT_TENANT
+        item['name_sort_key'] = university_name_sort_key(self.university_name, self.university_id)
         return item
 
     @classmethod
@@ -86,10 +160,94 @@ class UniversityModel(BaseModel):
         if 'updated_at' in data and isinstance(data['updated_at'], str):
             data['updated_at'] = datetime.fromisoformat(data['updated_at'])
 
-        return cls(**data)
+        # Stored items were validated on write, so skip re-validation on reads
+        return cls.model_construct(**data)
+
+    @staticmethod
+    def dynamodb_item_to_api_dict(item: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a stored DynamoDB item straight to the API dictionary.
+
+        Skips model construction for read paths; items were validated when
+        written and timestamps are already stored as ISO strings.
+        """
+        return {
+            'university_id': item['university_id'],
+            'university_code': item['university_code'],
+            'university_name': item['university_name'],
+            'domain': item['domain'],
+            'status': item.get('status', 'active'),
+            'address': item.get('address'),
+            'timezone': item.get('timezone', 'America/New_York'),
+            'created_at': item['created_at'],
+            'updated_at': item['updated_at'],
+        }
 
     class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
         arbitrary_types_allowed = True
+        # Instances are never mutated after validation, and rejecting unknown keys
+        # skips collecting extras during validation
+        frozen = True
+        extra = 'forbid'
+
+
+class UniversityUpsertInput(BaseModel):
+    """
+    Client-supplied fields of a university upsert.
+
+    Validates only what the request provides, so the write path can build the
+    DynamoDB item directly instead of round-tripping through UniversityModel.
+    """
+    university_code: str
+    university_name: str
+    domain: str
+    status: str = "active"
+    address: Optional[str] = None
+    timezone: str = "America/New_York"
+
+    @field_validator('university_code')
+    @classmethod
+    def validate_university_code(cls, v: str) -> str:
+        """Validate university code format (uppercase alphanumeric, 2-10 chars)."""
+        return _check_university_code(v)
+
+    @field_validator('domain')
+    @classmethod
+    def validate_domain(cls, v: str) -> str:
+        """Validate domain format (basic domain validation)."""
+        return _check_domain(v)
+
+    @field_validator('status')
+    @classmethod
+    def validate_status(cls, v: str) -> str:
+        """Validate status is either active or inactive."""
+        return _check_status(v)
+
+    def to_dynamodb_item(self, university_id: str, timestamp: str) -> Dict[str, Any]:
+        """
+        Build the DynamoDB item for this input.
+
+        Args:
+            university_id: Primary key of the university
+            timestamp: ISO-8601 string used for both created_at and updated_at
+
+        Returns:
+            Item in the same shape as UniversityModel.to_dynamodb_item
+        """
+        return {
+            'university_id': university_id,
+            'university_code': self.university_code,
+            'university_name': self.university_name,
+            'domain': self.domain,
+            'status': self.status,
+            'address': self.address,
+            'timezone': self.timezone,
+            'created_at': timestamp,
+            'updated_at': timestamp,
+            'tenant': DEFAULT_TENANT,
+            'name_sort_key': university_name_sort_key(self.university_name, university_id),
+        }
+
+    class Config:
+        frozen = True
+        extra = 'forbid'
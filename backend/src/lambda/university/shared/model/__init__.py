@@ -1,4 +1,4 @@
 """Data models for university domain."""
-from university.shared.model.UniversityModel import UniversityModel
+from university.shared.model.UniversityModel import UniversityModel, UniversityUpsertInput
 
-__all__ = ['UniversityModel']
+__all__ = ['UniversityModel', 'UniversityUpsertInput']
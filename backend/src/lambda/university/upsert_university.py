@@ -6,18 +6,21 @@ Admin-only endpoint to create or update university information.
 
 import logging
 import os
-import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-import boto3
 from botocore.exceptions import ClientError
 from pydantic import ValidationError
 
-from university.shared.model.UniversityModel import UniversityModel
+from university.shared.model.UniversityModel import (
+    UniversityModel,
+    UniversityUpsertInput,
+    university_id_for_code
+)
+from utils import aws_utils
 from utils.api_response import APIResponse
 from utils.auth_utils import require_role, UserRole, AuthorizationError, create_forbidden_response
-from utils.request_utils import parse_json_body, extract_path_parameter
+from utils.request_utils import parse_json_body, extract_path_parameter, validate_required_fields
 
 # Configure logging
 logger = logging.getLogger()
@@ -27,9 +30,23 @@ logger.setLevel(logging.INFO)
 UNIVERSITIES_TABLE_NAME = os.environ.get('UNIVERSITIES_TABLE_NAME')
 
 # Initialize DynamoDB resource
-dynamodb = boto3.resource('dynamodb')
+dynamodb = aws_utils.get_dynamodb_resource()
 universities_table = dynamodb.Table(UNIVERSITIES_TABLE_NAME)
 
+# Constants
+UNIVERSITY_EXISTS_CONDITION = 'attribute_exists(university_id)'
+UNIVERSITY_NOT_EXISTS_CONDITION = 'attribute_not_exists(university_id)'
+UNIVERSITY_UPDATE_EXPRESSION = (
+    'SET university_name = :name, #domain = :domain, #status = :status, address = :address, '
+    '#timezone = :timezone, updated_at = :updated_at, tenant = :tenant, name_sort_key = :name_sort_key'
+)
+# domain, status and timezone are DynamoDB reserved words
+UNIVERSITY_UPDATE_NAMES = {
+    '#domain': 'domain',
+    '#status': 'status',
+    '#timezone': 'timezone',
+}
+
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -46,9 +63,9 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         # Check authorization - only Admin can upsert universities
         try:
             user_context = require_role(event, [UserRole.ADMIN])
-            logger.info(f"User {user_context['user_id']} authorized as Admin")
+            logger.info("User %s authorized as Admin", user_context['user_id'])
         except AuthorizationError as e:
-            logger.warning(f"Authorization failed: {str(e)}")
+            logger.warning("Authorization failed: %s", e)
             return create_forbidden_response()
 
         # Extract university_code from path parameters
@@ -56,7 +73,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         if error:
             return error
         university_code = university_code.upper()
-        logger.info(f"Processing upsert for university code: {university_code}")
+        logger.info("Processing upsert for university code: %s", university_code)
 
         # Parse request body
         body, error = parse_json_body(event)
@@ -64,64 +81,100 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             return error
 
         # Validate required fields in body
-        from utils.request_utils import validate_required_fields
         error = validate_required_fields(body, ['university_name', 'domain'])
         if error:
             return error
 
         # Check if university_code in body matches path parameter (if provided)
         if 'university_code' in body and body['university_code'].upper() != university_code:
-            logger.warning(f"Mismatched university_code in path and body")
+            logger.warning("Mismatched university_code in path and body")
             return APIResponse.bad_request('University code in path must match university_code in body')
 
-        # Query to check if university already exists
-        query_response = universities_table.query(
-            IndexName='university-code-index',
-            KeyConditionExpression='university_code = :code',
-            ExpressionAttributeValues={
-                ':code': university_code
-            }
-        )
-
-        is_update = len(query_response.get('Items', [])) > 0
-        existing_university_id = query_response['Items'][0]['university_id'] if is_update else None
-
-        current_time = datetime.now(timezone.utc)
-
-        # Prepare university data
-        university_data = {
-            'university_id': existing_university_id or str(uuid.uuid4()),
-            'university_code': university_code,
-            'university_name': body['university_name'],
-            'domain': body['domain'],
-            'status': body.get('status', 'active'),
-            'address': body.get('address'),
-            'timezone': body.get('timezone', 'America/New_York'),
-            'created_at': query_response['Items'][0]['created_at'] if is_update else current_time,
-            'updated_at': current_time,
-        }
-
-        # Validate using Pydantic model
+        # Validate only the client-supplied fields; the item is built from them directly
         try:
-            university_model = UniversityModel.from_dict(university_data)
+            upsert_input = UniversityUpsertInput(
+                university_code=university_code,
+                university_name=body['university_name'],
+                domain=body['domain'],
+                status=body.get('status', 'active'),
+                address=body.get('address'),
+                timezone=body.get('timezone', 'America/New_York')
+            )
         except ValidationError as ve:
-            logger.warning(f"Validation error: {str(ve)}")
+            logger.warning("Validation error: %s", ve)
             return APIResponse.unprocessable_entity('Validation error', errors=ve.errors())
 
-        # Save to DynamoDB
-        universities_table.put_item(Item=university_model.to_dynamodb_item())
-
-        logger.info(f"Successfully {'updated' if is_update else 'created'} university: {university_code}")
+        # The ID is derived from the code so the write can be conditional on the
+        # primary key without a lookup on the code GSI; the same item backs the
+        # write and the response
+        timestamp = datetime.now(timezone.utc).isoformat()
+        item = upsert_input.to_dynamodb_item(university_id_for_code(university_code), timestamp)
 
-        if is_update:
-            return APIResponse.ok(university_model.to_dict())
-        else:
-            return APIResponse.created(university_model.to_dict())
+        # Create path: a single conditional put. Universities created before IDs
+        # were derived from codes are moved to their derived ID by rekey_universities.
+        try:
+            universities_table.put_item(
+                Item=item,
+                ConditionExpression=UNIVERSITY_NOT_EXISTS_CONDITION
+            )
+            logger.info("Successfully created university: %s", university_code)
+            return APIResponse.created(UniversityModel.dynamodb_item_to_api_dict(item))
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+
+        # Update path: keep created_at and overwrite everything else
+        updated = _update_existing_university(item)
+        if updated is None:
+            logger.warning("University %s was deleted during upsert", university_code)
+            return APIResponse.conflict(f'University with code {university_code} was modified concurrently')
+
+        logger.info("Successfully updated university: %s", university_code)
+        return APIResponse.ok(UniversityModel.dynamodb_item_to_api_dict(updated))
 
     except ClientError as e:
-        logger.error(f"DynamoDB error: {str(e)}")
+        logger.error("DynamoDB error: %s", e)
         return APIResponse.internal_error('Failed to upsert university')
 
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         return APIResponse.internal_error('An unexpected error occurred')
+
+
+def _update_existing_university(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Overwrite an existing university's fields while preserving created_at.
+
+    Also sets the by-tenant-name GSI keys, so updating a university written
+    before that index existed adds it to the index.
+
+    Args:
+        item: Validated DynamoDB item carrying the new field values
+
+    Returns:
+        Updated DynamoDB item, or None if no university has the item's ID
+    """
+    try:
+        response = universities_table.update_item(
+            Key={'university_id': item['university_id']},
+            UpdateExpression=UNIVERSITY_UPDATE_EXPRESSION,
+            ConditionExpression=UNIVERSITY_EXISTS_CONDITION,
+            ExpressionAttributeNames=UNIVERSITY_UPDATE_NAMES,
+            ExpressionAttributeValues={
+                ':name': item['university_name'],
+                ':domain': item['domain'],
+                ':status': item['status'],
+                ':address': item['address'],
+                ':timezone': item['timezone'],
+                ':updated_at': item['updated_at'],
+                ':tenant': item['tenant'],
+                ':name_sort_key': item['name_sort_key'],
+            },
+            ReturnValues='ALL_NEW'
+        )
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+            return None
+        raise
+    return response['Attributes']
+
@@ -23,11 +23,13 @@ Usage:
     return APIResponse.internal_error('Processing failed')
 """
 
-import json
 import logging
 from decimal import Decimal
+from functools import lru_cache
 from enum import IntEnum
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Final, Optional, Tuple, Union
+
+import orjson
 
 from constants.constants import DEFAULT_HEADERS
 
@@ -60,23 +62,78 @@ class HTTPStatus(IntEnum):
     SERVICE_UNAVAILABLE = 503
 
 
-class JSONEncoder(json.JSONEncoder):
+# Plain-int status codes used when building responses, so the hot path passes
+# ints instead of enum members and statusCode is always a plain int
+_OK: Final[int] = HTTPStatus.OK.value
+_CREATED: Final[int] = HTTPStatus.CREATED.value
+_ACCEPTED: Final[int] = HTTPStatus.ACCEPTED.value
+_NO_CONTENT: Final[int] = HTTPStatus.NO_CONTENT.value
+_BAD_REQUEST: Final[int] = HTTPStatus.BAD_REQUEST.value
+_UNAUTHORIZED: Final[int] = HTTPStatus.UNAUTHORIZED.value
+_FORBIDDEN: Final[int] = HTTPStatus.FORBIDDEN.value
+_NOT_FOUND: Final[int] = HTTPStatus.NOT_FOUND.value
+_METHOD_NOT_ALLOWED: Final[int] = HTTPStatus.METHOD_NOT_ALLOWED.value
+_CONFLICT: Final[int] = HTTPStatus.CONFLICT.value
+_PAYLOAD_TOO_LARGE: Final[int] = HTTPStatus.PAYLOAD_TOO_LARGE.value
+_UNPROCESSABLE_ENTITY: Final[int] = HTTPStatus.UNPROCESSABLE_ENTITY.value
+_INTERNAL_SERVER_ERROR: Final[int] = HTTPStatus.INTERNAL_SERVER_ERROR.value
+_SERVICE_UNAVAILABLE: Final[int] = HTTPStatus.SERVICE_UNAVAILABLE.value
+
+
+def _json_default(obj: Any) -> Any:
     """
-    Custom JSON encoder to handle special types commonly used in AWS Lambda.
+    Serialize types that orjson does not handle natively.
 
     Handles:
     - Decimal (from DynamoDB)
-    - datetime objects
-    - Enum types
+
+    datetime and Enum values are serialized by orjson itself.
+    """
+    if isinstance(obj, Decimal):
+        # Convert Decimal to int if it's a whole number, otherwise float
+        if obj % 1 == 0:
+            return int(obj)
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+@lru_cache(maxsize=64)
+def _method_not_allowed_body(method: str, allowed_methods: Optional[Tuple[str, ...]] = None) -> str:
+    """
+    Serialize a 405 body, caching the result.
+
+    Each function accepts a fixed set of methods, so only a handful of
+    distinct bodies occur per execution environment.
     """
+    body = {
+        'error': 'Method Not Allowed',
+        'message': f'HTTP method {method} is not supported.'
+    }
+    if allowed_methods:
+        body['allowed_methods'] = allowed_methods
+    return orjson.dumps(body).decode('utf-8')
 
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            # Convert Decimal to int if it's a whole number, otherwise float
-            if obj % 1 == 0:
-                return int(obj)
-            return float(obj)
-        return super().default(obj)
+
+# Bodies that never vary are serialized once at import
+_EMPTY_JSON_BODY = '{}'
+_CORS_PREFLIGHT_BODY = orjson.dumps({'message': 'CORS preflight successful'}).decode('utf-8')
+
+
+@lru_cache(maxsize=256)
+def _error_body(error: str, message: str, resource_type: Optional[str] = None) -> str:
+    """
+    Serialize a standard error body, caching the result.
+
+    Error responses repeat the same few messages, so each distinct body is
+    only serialized once per execution environment.
+    """
+    body = {
+        'error': error,
+        'message': message
+    }
+    if resource_type:
+        body['resource_type'] = resource_type
+    return orjson.dumps(body).decode('utf-8')
 
 
 class APIResponse:
@@ -105,12 +162,12 @@ class APIResponse:
         Returns:
             API Gateway response dictionary
         """
-        # Start with default headers (includes CORS)
-        response_headers = dict(DEFAULT_HEADERS)
-
-        # Merge additional headers if provided
+        # Every response gets its own headers dict (includes CORS), so a handler
+        # mutating one response cannot change the defaults for later requests
         if headers:
-            response_headers.update(headers)
+            response_headers = {**DEFAULT_HEADERS, **headers}
+        else:
+            response_headers = dict(DEFAULT_HEADERS)
 
         # Build response
         response = {
@@ -122,20 +179,61 @@ class APIResponse:
         if body is not None:
             if isinstance(body, str):
                 response['body'] = body
+            elif isinstance(body, dict) and not body:
+                response['body'] = _EMPTY_JSON_BODY
             else:
                 try:
-                    response['body'] = json.dumps(body, cls=JSONEncoder)
+                    response['body'] = orjson.dumps(body, default=_json_default).decode('utf-8')
                 except (TypeError, ValueError) as e:
-                    logger.error(f"Failed to serialize response body: {e}")
-                    # Fallback to error response
-                    return APIResponse.internal_error(
-                        "Failed to serialize response data"
-                    )
+                    logger.error("Failed to serialize response body: %s", e)
+                    # Fall back to a pre-serialized error body so this path cannot recurse
+                    response['statusCode'] = _INTERNAL_SERVER_ERROR
+                    response['body'] = _error_body('Internal Server Error', 'Failed to serialize response data')
         else:
-            response['body'] = json.dumps({})
+            response['body'] = _EMPTY_JSON_BODY
 
         return response
 
+    @staticmethod
+    def _success(
+            status_code: int,
+            data: Any,
+            message: Optional[str],
+            headers: Optional[Dict[str, str]]
+    ) -> Dict[str, Any]:
+        """
+        Build a 2xx response with data at the root level, shared by ok and created.
+
+        Args:
+            status_code: HTTP status code
+            data: Response data (any JSON-serializable object). If dict, returned at root level.
+            message: Optional success message. If provided with dict data, merged into response.
+            headers: Optional additional headers
+
+        Returns:
+            API Gateway response dictionary
+        """
+        # If no data and no message, return empty body
+        if data is None and message is None:
+            return APIResponse._build_response(status_code, {}, headers)
+
+        # If only message, return just message
+        if data is None and message:
+            return APIResponse._build_response(status_code, {'message': message}, headers)
+
+        # If only data (most common case), return data directly at root
+        if message is None:
+            return APIResponse._build_response(status_code, data, headers)
+
+        # Both message and data provided
+        if isinstance(data, dict):
+            # Merge message into data dict (industry standard)
+            body = {'message': message, **data}
+        else:
+            # Non-dict data with message: wrap in 'data' field
+            body = {'message': message, 'data': data}
+        return APIResponse._build_response(status_code, body, headers)
+
     # -------------------------------------------------------------------------
     # Success Responses (2xx)
     # -------------------------------------------------------------------------
@@ -173,25 +271,7 @@ class APIResponse:
             return APIResponse.ok({'user_id': '123'}, message='User retrieved')
             # Returns: {"user_id": "123", "message": "User retrieved"}
         """
-        if data is None and message is None:
-            return APIResponse._build_response(HTTPStatus.OK, {}, headers)
-
-        if data is None and message:
-            return APIResponse._build_response(HTTPStatus.OK, {'message': message}, headers)
-
-        # If only data (most common case), return data directly at root
-        if message is None:
-            return APIResponse._build_response(HTTPStatus.OK, data, headers)
-
-        # Both message and data provided
-        if isinstance(data, dict):
-            # Merge message into data dict (industry standard)
-            body = {'message': message, **data}
-            return APIResponse._build_response(HTTPStatus.OK, body, headers)
-        else:
-            # Non-dict data with message: wrap in 'data' field
-            body = {'message': message, 'data': data}
-            return APIResponse._build_response(HTTPStatus.OK, body, headers)
+        return APIResponse._success(_OK, data, message, headers)
 
     @staticmethod
     def created(
@@ -222,27 +302,7 @@ class APIResponse:
             return APIResponse.created({'id': '123'}, message='Resource created successfully')
             # Returns: {"id": "123", "message": "Resource created successfully"}
         """
-        # If no data and no message, return empty body
-        if data is None and message is None:
-            return APIResponse._build_response(HTTPStatus.CREATED, {}, headers)
-
-        # If only message, return just message
-        if data is None and message:
-            return APIResponse._build_response(HTTPStatus.CREATED, {'message': message}, headers)
-
-        # If only data (most common case), return data directly at root
-        if message is None:
-            return APIResponse._build_response(HTTPStatus.CREATED, data, headers)
-
-        # Both message and data provided
-        if isinstance(data, dict):
-            # Merge message into data dict (industry standard)
-            body = {'message': message, **data}
-            return APIResponse._build_response(HTTPStatus.CREATED, body, headers)
-        else:
-            # Non-dict data with message: wrap in 'data' field
-            body = {'message': message, 'data': data}
-            return APIResponse._build_response(HTTPStatus.CREATED, body, headers)
+        return APIResponse._success(_CREATED, data, message, headers)
 
     @staticmethod
     def accepted(
@@ -268,7 +328,7 @@ class APIResponse:
         if tracking_id:
             body['tracking_id'] = tracking_id
 
-        return APIResponse._build_response(HTTPStatus.ACCEPTED, body, headers)
+        return APIResponse._build_response(_ACCEPTED, body, headers)
 
     @staticmethod
     def no_content(headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
@@ -281,7 +341,8 @@ class APIResponse:
         Returns:
             204 No Content response
         """
-        return APIResponse._build_response(HTTPStatus.NO_CONTENT, None, headers)
+        # 204 responses must not carry a body
+        return APIResponse._build_response(_NO_CONTENT, '', headers)
 
     # -------------------------------------------------------------------------
     # Client Error Responses (4xx)
@@ -308,14 +369,17 @@ class APIResponse:
             return APIResponse.bad_request('Invalid email format')
             return APIResponse.bad_request('Validation failed', errors={'email': 'required'})
         """
+        if errors is None:
+            return APIResponse._build_response(
+                _BAD_REQUEST, _error_body('Bad Request', message), headers
+            )
+
         body = {
             'error': 'Bad Request',
-            'message': message
+            'message': message,
+            'errors': errors
         }
-        if errors is not None:
-            body['errors'] = errors
-
-        return APIResponse._build_response(HTTPStatus.BAD_REQUEST, body, headers)
+        return APIResponse._build_response(_BAD_REQUEST, body, headers)
 
     @staticmethod
     def unauthorized(
@@ -335,11 +399,9 @@ class APIResponse:
         Example:
             return APIResponse.unauthorized('Invalid credentials')
         """
-        body = {
-            'error': 'Unauthorized',
-            'message': message
-        }
-        return APIResponse._build_response(HTTPStatus.UNAUTHORIZED, body, headers)
+        return APIResponse._build_response(
+            _UNAUTHORIZED, _error_body('Unauthorized', message), headers
+        )
 
     @staticmethod
     def forbidden(
@@ -359,11 +421,9 @@ class APIResponse:
         Example:
             return APIResponse.forbidden('Admin access required')
         """
-        body = {
-            'error': 'Forbidden',
-            'message': message
-        }
-        return APIResponse._build_response(HTTPStatus.FORBIDDEN, body, headers)
+        return APIResponse._build_response(
+            _FORBIDDEN, _error_body('Forbidden', message), headers
+        )
 
     @staticmethod
     def not_found(
@@ -385,14 +445,9 @@ class APIResponse:
         Example:
             return APIResponse.not_found('Student not found', 'Student')
         """
-        body = {
-            'error': 'Not Found',
-            'message': message
-        }
-        if resource_type:
-            body['resource_type'] = resource_type
-
-        return APIResponse._build_response(HTTPStatus.NOT_FOUND, body, headers)
+        return APIResponse._build_response(
+            _NOT_FOUND, _error_body('Not Found', message, resource_type), headers
+        )
 
     @staticmethod
     def method_not_allowed(
@@ -414,14 +469,11 @@ class APIResponse:
         Example:
             return APIResponse.method_not_allowed('DELETE', ['GET', 'POST'])
         """
-        body = {
-            'error': 'Method Not Allowed',
-            'message': f'HTTP method {method} is not supported.'
-        }
-        if allowed_methods:
-            body['allowed_methods'] = allowed_methods
-
-        return APIResponse._build_response(HTTPStatus.METHOD_NOT_ALLOWED, body, headers)
+        return APIResponse._build_response(
+            _METHOD_NOT_ALLOWED,
+            _method_not_allowed_body(method, tuple(allowed_methods) if allowed_methods else None),
+            headers
+        )
 
     @staticmethod
     def conflict(
@@ -441,11 +493,9 @@ class APIResponse:
         Example:
             return APIResponse.conflict('Email already exists')
         """
-        body = {
-            'error': 'Conflict',
-            'message': message
-        }
-        return APIResponse._build_response(HTTPStatus.CONFLICT, body, headers)
+        return APIResponse._build_response(
+            _CONFLICT, _error_body('Conflict', message), headers
+        )
 
     @staticmethod
     def payload_too_large(
@@ -474,7 +524,7 @@ class APIResponse:
         if max_size:
             body['max_size'] = max_size
 
-        return APIResponse._build_response(HTTPStatus.PAYLOAD_TOO_LARGE, body, headers)
+        return APIResponse._build_response(_PAYLOAD_TOO_LARGE, body, headers)
 
     @staticmethod
     def unprocessable_entity(
@@ -503,7 +553,7 @@ class APIResponse:
         if errors is not None:
             body['errors'] = errors
 
-        return APIResponse._build_response(HTTPStatus.UNPROCESSABLE_ENTITY, body, headers)
+        return APIResponse._build_response(_UNPROCESSABLE_ENTITY, body, headers)
 
     # -------------------------------------------------------------------------
     # Server Error Responses (5xx)
@@ -530,13 +580,11 @@ class APIResponse:
             return APIResponse.internal_error('Database connection failed')
         """
         if log_error:
-            logger.error(f"Internal server error: {message}")
+            logger.error("Internal server error: %s", message)
 
-        body = {
-            'error': 'Internal Server Error',
-            'message': message
-        }
-        return APIResponse._build_response(HTTPStatus.INTERNAL_SERVER_ERROR, body, headers)
+        return APIResponse._build_response(
+            _INTERNAL_SERVER_ERROR, _error_body('Internal Server Error', message), headers
+        )
 
     @staticmethod
     def service_unavailable(
@@ -568,7 +616,7 @@ class APIResponse:
                 headers = {}
             headers['Retry-After'] = str(retry_after)
 
-        return APIResponse._build_response(HTTPStatus.SERVICE_UNAVAILABLE, body, headers)
+        return APIResponse._build_response(_SERVICE_UNAVAILABLE, body, headers)
 
     # -------------------------------------------------------------------------
     # Special Responses
@@ -586,7 +634,7 @@ class APIResponse:
             if event['httpMethod'] == 'OPTIONS':
                 return APIResponse.cors_preflight()
         """
-        return APIResponse.ok(message='CORS preflight successful')
+        return APIResponse._build_response(_OK, _CORS_PREFLIGHT_BODY)
 
     @staticmethod
     def paginated(
@@ -629,7 +677,7 @@ class APIResponse:
         if total_count is not None:
             body['total_count'] = total_count
 
-        return APIResponse._build_response(HTTPStatus.OK, body, headers)
+        return APIResponse._build_response(_OK, body, headers)
 
 
 # Convenience function for backward compatibility
@@ -5,11 +5,18 @@ Provides functions for extracting user context from Cognito claims,
 role-based authorization checks, and standardized auth error responses.
 """
 
+import re
 from enum import Enum
 from typing import Dict, List, Any
 
 from utils.api_response import APIResponse
 
+# Separator for the comma-separated cognito:groups claim, absorbing surrounding whitespace
+_GROUP_SPLIT = re.compile(r'\s*,\s*')
+
+# Event key under which the parsed user context is memoized for the rest of the invocation
+_USER_CONTEXT_KEY = '_user_context'
+
 
 class UserRole(str, Enum):
     """Enum for user roles matching Cognito Group names."""
@@ -31,29 +38,59 @@ def extract_user_context(event: Dict[str, Any]) -> Dict[str, Any]:
         event: API Gateway event containing request context with Cognito claims
 
     Returns:
-        Dictionary with user_id, email, and list of group names
+        Dictionary with user_id, email, and a frozenset of group names
 
     Example:
         {
             'user_id': 'abc-123-def',
             'email': 'user@example.com',
-            'groups': ['Student', 'Admin']
+            'groups': frozenset({'Student', 'Admin'})
         }
 
     Raises:
         KeyError: If required claims are missing from event
     """
-    claims = event['requestContext']['authorizer']['claims']
-    groups_str = claims.get('cognito:groups', '')
+    # Handlers often run several role checks per request; parse the claims only once
+    user_context = event.get(_USER_CONTEXT_KEY)
+    if user_context is not None:
+        return user_context
 
-    # Parse comma-separated groups string
-    groups = [g.strip() for g in groups_str.split(',')] if groups_str else []
-
-    return {
+    claims = event['requestContext']['authorizer']['claims']
+    groups_claim = claims.get('cognito:groups')
+
+    # Authorizers that forward the claim as a JSON array need no parsing; the
+    # REST API Cognito authorizer sends a comma-separated string instead
+    if isinstance(groups_claim, list):
+        groups = frozenset(groups_claim)
+    elif groups_claim and ',' not in groups_claim:
+        # Most users are in exactly one group, which needs no splitting
+        groups = frozenset((groups_claim.strip(),))
+    elif groups_claim:
+        groups = frozenset(_GROUP_SPLIT.split(groups_claim.strip()))
+    else:
+        groups = frozenset()
+
+    user_context = {
         'user_id': claims['sub'],
         'email': claims.get('email', ''),
         'groups': groups
     }
+    event[_USER_CONTEXT_KEY] = user_context
+    return user_context
+
+
+def has_role(event: Dict[str, Any], role: str) -> bool:
+    """
+    Check if user is in the given Cognito group.
+
+    Args:
+        event: API Gateway event
+        role: Role name (e.g., UserRole.ADMIN)
+
+    Returns:
+        True if user has the role, False otherwise
+    """
+    return role in extract_user_context(event)['groups']
 
 
 def require_role(event: Dict[str, Any], required_roles: List[str]) -> Dict[str, Any]:
@@ -80,7 +117,7 @@ def require_role(event: Dict[str, Any], required_roles: List[str]) -> Dict[str,
     user_context = extract_user_context(event)
 
     # Check if user has at least one of the required roles
-    if not any(role in user_context['groups'] for role in required_roles):
+    if user_context['groups'].isdisjoint(required_roles):
         raise AuthorizationError(f"Required roles: {required_roles}, user has: {user_context['groups']}")
 
     return user_context
@@ -96,8 +133,7 @@ def is_admin(event: Dict[str, Any]) -> bool:
     Returns:
         True if user is admin, False otherwise
     """
-    user_context = extract_user_context(event)
-    return UserRole.ADMIN in user_context['groups']
+    return has_role(event, UserRole.ADMIN)
 
 
 def is_instructor(event: Dict[str, Any]) -> bool:
@@ -110,8 +146,7 @@ def is_instructor(event: Dict[str, Any]) -> bool:
     Returns:
         True if user is instructor, False otherwise
     """
-    user_context = extract_user_context(event)
-    return UserRole.INSTRUCTOR in user_context['groups']
+    return has_role(event, UserRole.INSTRUCTOR)
 
 
 def is_student(event: Dict[str, Any]) -> bool:
@@ -124,8 +159,7 @@ def is_student(event: Dict[str, Any]) -> bool:
     Returns:
         True if user is student, False otherwise
     """
-    user_context = extract_user_context(event)
-    return UserRole.STUDENT in user_context['groups']
+    return has_role(event, UserRole.STUDENT)
 
 
 def create_forbidden_response(message: str = "Insufficient permissions") -> Dict[str, Any]:
@@ -1,12 +1,134 @@
-from typing import Any
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Tuple
 
 import boto3
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
 from botocore.client import BaseClient
+from botocore.config import Config
+
+logger = logging.getLogger()
+
+# Single session and client config shared by every handler in the execution environment.
+# Adaptive retries smooth out DynamoDB throttling during class-start spikes, and keep-alive
+# lets warm invocations reuse pooled connections instead of repeating TLS handshakes.
+_SESSION = boto3.session.Session()
+_CONFIG = Config(
+    retries={'mode': 'adaptive', 'max_attempts': 3},
+    tcp_keepalive=True,
+    max_pool_connections=50,
+)
+# DynamoDB calls complete in milliseconds, so a short connect timeout lets a stalled
+# connection fail over to a retry instead of waiting out the 60s botocore default.
+# Retrying after a connect timeout is always safe because the request was never sent.
+_DYNAMODB_CONFIG = _CONFIG.merge(Config(connect_timeout=1))
+# The short read timeout is reserved for read-only handlers: a write that succeeds but
+# answers late would be retried, and a conditional write would then fail its own condition
+_DYNAMODB_READ_CONFIG = _DYNAMODB_CONFIG.merge(Config(read_timeout=2))
+
+# Clients and resources built in this execution environment, keyed by service name.
+# Shared utils and handlers asking for the same service get the same instance.
+_CLIENTS: Dict[str, BaseClient] = {}
+_RESOURCES: Dict[str, Any] = {}
+
+# Attribute-value converters for handlers that use the low-level DynamoDB client
+_SERIALIZER = TypeSerializer()
+_DESERIALIZER = TypeDeserializer()
+
+
+def _config_for(resource_name: str) -> Config:
+    return _DYNAMODB_CONFIG if resource_name == 'dynamodb' else _CONFIG
 
 
 def get_client_for_resource(resource_name: str) -> BaseClient:
-    return boto3.client(resource_name)
+    client = _CLIENTS.get(resource_name)
+    if client is None:
+        client = _CLIENTS[resource_name] = _SESSION.client(resource_name, config=_config_for(resource_name))
+    return client
+
+
+def _create_client(resource_name: str) -> BaseClient:
+    # boto3 sessions are not thread-safe, so each parallel client gets its own
+    return boto3.session.Session().client(resource_name, config=_config_for(resource_name))
+
+
+def get_clients_in_parallel(*resource_names: str) -> Tuple[BaseClient, ...]:
+    """
+    Create several clients concurrently during cold start.
+
+    Service model loading and endpoint resolution dominate client construction,
+    so building the clients on separate threads overlaps that work.
+
+    Args:
+        resource_names: AWS service names (e.g. 'dynamodb', 'cognito-idp')
+
+    Returns:
+        Clients in the same order as resource_names
+    """
+    missing = [name for name in dict.fromkeys(resource_names) if name not in _CLIENTS]
+    if missing:
+        with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+            _CLIENTS.update(zip(missing, executor.map(_create_client, missing)))
+    return tuple(_CLIENTS[name] for name in resource_names)
+
+
+def get_dynamodb_resource(read_only: bool = False) -> Any:
+    """
+    Return the shared DynamoDB resource.
+
+    Args:
+        read_only: Use the short read timeout; only for handlers that never write
+
+    Returns:
+        boto3 DynamoDB service resource
+    """
+    key = 'dynamodb:read' if read_only else 'dynamodb'
+    resource = _RESOURCES.get(key)
+    if resource is None:
+        config = _DYNAMODB_READ_CONFIG if read_only else _DYNAMODB_CONFIG
+        resource = _RESOURCES[key] = _SESSION.resource('dynamodb', config=config)
+    return resource
+
+
+def get_dynamodb_read_client() -> BaseClient:
+    """Return the shared low-level DynamoDB client with the short read timeout, for read-only handlers."""
+    client = _CLIENTS.get('dynamodb:read')
+    if client is None:
+        client = _CLIENTS['dynamodb:read'] = _SESSION.client('dynamodb', config=_DYNAMODB_READ_CONFIG)
+    return client
+
+
+def warm_table_connection(table: Any) -> None:
+    """
+    Open a pooled DynamoDB connection during init by describing the table.
+
+    The DNS lookup and TLS handshake then happen in the init phase instead of
+    on the first request. Failures are logged and ignored; the handler will
+    simply connect on first use.
+
+    Args:
+        table: boto3 DynamoDB Table resource
+    """
+    try:
+        table.load()
+    except Exception as e:
+        logger.warning("Failed to warm connection for table %s: %s", table.name, e)
+
+
+def serialize_item(item: Dict[str, Any], skip_none: bool = True) -> Dict[str, Any]:
+    """
+    Convert a plain dict to DynamoDB attribute-value format for the low-level client.
+
+    Args:
+        item: Plain Python dictionary
+        skip_none: Drop None values instead of storing them as NULL attributes
+
+    Returns:
+        Dictionary of DynamoDB typed attribute values
+    """
+    return {key: _SERIALIZER.serialize(value) for key, value in item.items() if value is not None or not skip_none}
 
 
-def get_dynamodb_resource() -> Any:
-    return boto3.resource('dynamodb')
+def deserialize_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a DynamoDB attribute-value map returned by the low-level client to a plain dict."""
+    return {key: _DESERIALIZER.deserialize(value) for key, value in item.items()}
@@ -6,11 +6,12 @@ and handling DynamoDB pagination patterns.
 """
 
 import base64
-import json
 import logging
 from decimal import Decimal
 from typing import Any, Dict, Optional
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,7 +40,8 @@ def encode_last_evaluated_key(key: Optional[Dict[str, Any]]) -> Optional[str]:
     """
     Encode DynamoDB LastEvaluatedKey to base64 string for pagination.
 
-    This allows passing the pagination key as a query parameter safely.
+    Uses the URL-safe base64 alphabet so the key can be passed as a query
+    parameter without further escaping.
 
     Args:
         key: DynamoDB LastEvaluatedKey dictionary
@@ -50,16 +52,15 @@ def encode_last_evaluated_key(key: Optional[Dict[str, Any]]) -> Optional[str]:
     Example:
         last_key = {'user_id': 'abc123', 'timestamp': '2024-01-01'}
         encoded = encode_last_evaluated_key(last_key)
-        # Returns: 'eyJ1c2VyX2lkIjogImFiYzEyMyIsICJ0aW1lc3RhbXAiOiAiMjAyNC0wMS0wMSJ9'
+        # Returns: 'eyJ1c2VyX2lkIjoiYWJjMTIzIiwidGltZXN0YW1wIjoiMjAyNC0wMS0wMSJ9'
     """
     if not key:
         return None
 
     try:
-        key_json = json.dumps(key, default=decimal_to_float)
-        return base64.b64encode(key_json.encode('utf-8')).decode('utf-8')
+        return base64.urlsafe_b64encode(orjson.dumps(key, default=decimal_to_float)).decode('ascii')
     except Exception as e:
-        logger.error(f"Error encoding last evaluated key: {str(e)}")
+        logger.error("Error encoding last evaluated key: %s", e)
         return None
 
 
@@ -67,6 +68,9 @@ def decode_last_evaluated_key(encoded_key: Optional[str]) -> Optional[Dict[str,
     """
     Decode base64 string to DynamoDB LastEvaluatedKey.
 
+    Accepts both URL-safe and standard base64, so keys issued before the
+    switch to the URL-safe alphabet still decode.
+
     Args:
         encoded_key: Base64-encoded key string
 
@@ -74,7 +78,7 @@ def decode_last_evaluated_key(encoded_key: Optional[str]) -> Optional[Dict[str,
         DynamoDB key dictionary or None if encoded_key is None or invalid
 
     Example:
-        encoded = 'eyJ1c2VyX2lkIjogImFiYzEyMyJ9'
+        encoded = 'eyJ1c2VyX2lkIjoiYWJjMTIzIn0='
         key = decode_last_evaluated_key(encoded)
         # Returns: {'user_id': 'abc123'}
     """
@@ -82,10 +86,10 @@ def decode_last_evaluated_key(encoded_key: Optional[str]) -> Optional[Dict[str,
         return None
 
     try:
-        key_json = base64.b64decode(encoded_key.encode('utf-8')).decode('utf-8')
-        return json.loads(key_json)
-    except Exception as e:
-        logger.error(f"Error decoding last evaluated key: {str(e)}")
+        return orjson.loads(base64.urlsafe_b64decode(encoded_key))
+    except ValueError as e:
+        # Covers both malformed base64 and orjson.JSONDecodeError
+        logger.error("Error decoding last evaluated key: %s", e)
         return None
 
 
@@ -120,14 +124,15 @@ def parse_page_size(
         # Cap at maximum and ensure minimum of 1
         return max(1, min(size, max_size))
     except (ValueError, TypeError):
-        logger.warning(f"Invalid page_size value: {page_size_str}, using default: {default}")
+        logger.warning("Invalid page_size value: %s, using default: %s", page_size_str, default)
         return default
 
 
 def build_pagination_response(
         items: list,
         last_evaluated_key: Optional[Dict[str, Any]] = None,
-        total_count: Optional[int] = None
+        total_count: Optional[int] = None,
+        items_key: str = 'items'
 ) -> Dict[str, Any]:
     """
     Build a standardized pagination response dictionary.
@@ -136,6 +141,8 @@ def build_pagination_response(
         items: List of items for current page
         last_evaluated_key: DynamoDB LastEvaluatedKey (will be encoded)
         total_count: Optional total count of items
+        items_key: Response key for the items (e.g. 'students'), so callers
+            get their API shape without copying the dictionary
 
     Returns:
         Dictionary with items, pagination metadata
@@ -159,7 +166,7 @@ def build_pagination_response(
     has_more = last_evaluated_key is not None
 
     response = {
-        'items': items,
+        items_key: items,
         'count': len(items),
         'has_more': has_more
     }
@@ -6,14 +6,22 @@ including HTTP method validation, body parsing, and parameter extraction.
 """
 
 import base64
-import json
 import logging
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional, Tuple
 
-from utils.api_response import APIResponse
+import orjson
+
+# create_response is re-exported for backward compatibility with older handlers
+from utils.api_response import APIResponse, create_response  # noqa: F401
 
 logger = logging.getLogger(__name__)
 
+_HTTP_METHODS = frozenset(('GET', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS', 'HEAD'))
+
+# Shared stand-in for absent pathParameters/queryStringParameters (API Gateway sends null)
+_NO_PARAMS = MappingProxyType({})
+
 
 def parse_json_body(event: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
     """
@@ -35,31 +43,26 @@ def parse_json_body(event: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Op
             return error
         # Use body...
     """
-    try:
-        body_str = event.get('body')
-
-        if not body_str:
-            return None, APIResponse.bad_request('Request body is required')
+    body_str = event.get('body')
 
-        # Handle base64 encoding
-        if event.get('isBase64Encoded', False):
-            try:
-                body_str = base64.b64decode(body_str).decode('utf-8')
-            except Exception as e:
-                logger.error(f"Failed to decode base64 body: {e}")
-                return None, APIResponse.bad_request('Invalid base64-encoded body')
+    if not body_str:
+        return None, APIResponse.bad_request('Request body is required')
 
-        # Parse JSON
+    # Handle base64 encoding; orjson parses the decoded bytes directly,
+    # so the body is never materialized as an intermediate str
+    if event.get('isBase64Encoded', False):
         try:
-            body = json.loads(body_str)
-            return body, None
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON body: {e}")
-            return None, APIResponse.bad_request('Invalid JSON in request body')
+            body_str = base64.b64decode(body_str)
+        except ValueError as e:
+            logger.error("Failed to decode base64 body: %s", e)
+            return None, APIResponse.bad_request('Invalid base64-encoded body')
 
-    except Exception as e:
-        logger.error(f"Unexpected error parsing request body: {e}")
-        return None, APIResponse.internal_error('Failed to parse request body')
+    # Parse JSON
+    try:
+        return orjson.loads(body_str), None
+    except orjson.JSONDecodeError as e:
+        logger.error("Failed to parse JSON body: %s", e)
+        return None, APIResponse.bad_request('Invalid JSON in request body')
 
 
 def validate_http_method(
@@ -83,7 +86,9 @@ def validate_http_method(
         if error:
             return error
     """
-    http_method = event.get('httpMethod', '').upper()
+    # API Gateway already sends uppercase methods; only normalize unexpected values
+    raw_method = event.get('httpMethod', '')
+    http_method = raw_method if raw_method in _HTTP_METHODS else raw_method.upper()
 
     # Handle CORS preflight
     if http_method == 'OPTIONS':
@@ -115,15 +120,18 @@ def validate_required_fields(
         if error:
             return error
     """
-    missing_fields = [field for field in required_fields if field not in body or body[field] is None]
-
-    if missing_fields:
-        return APIResponse.bad_request(
-            f"Missing required fields: {', '.join(missing_fields)}",
-            errors={'missing_fields': missing_fields}
-        )
+    # Valid bodies are the common case; only build the missing list on failure
+    for field in required_fields:
+        if body.get(field) is None:
+            break
+    else:
+        return None
 
-    return None
+    missing_fields = [field for field in required_fields if body.get(field) is None]
+    return APIResponse.bad_request(
+        f"Missing required fields: {', '.join(missing_fields)}",
+        errors={'missing_fields': missing_fields}
+    )
 
 
 def extract_path_parameter(
@@ -149,8 +157,7 @@ def extract_path_parameter(
         if error:
             return error
     """
-    path_params = event.get('pathParameters') or {}
-    value = path_params.get(parameter_name)
+    value = (event.get('pathParameters') or _NO_PARAMS).get(parameter_name)
 
     if required and not value:
         return None, APIResponse.bad_request(f"Missing required path parameter: {parameter_name}")
@@ -177,8 +184,7 @@ def extract_query_parameter(
     Example:
         page_size = extract_query_parameter(event, 'page_size', default=20)
     """
-    query_params = event.get('queryStringParameters') or {}
-    return query_params.get(parameter_name, default)
+    return (event.get('queryStringParameters') or _NO_PARAMS).get(parameter_name, default)
 
 
 def validate_request(event):
@@ -204,22 +210,3 @@ def validate_request(event):
         return APIResponse.bad_request('Request body is required')
 
     return None
-
-
-# Re-export for backward compatibility
-def create_response(status_code: int, body: Dict[str, Any], headers: Dict[str, str] = None) -> Dict[str, Any]:
-    """
-    Legacy function for backward compatibility.
-
-    Args:
-        status_code: HTTP status code
-        body: Response body dictionary
-        headers: Optional additional headers
-
-    Returns:
-        API Gateway response dictionary
-
-    Note:
-        Consider using APIResponse methods instead for better type safety.
-    """
-    return APIResponse._build_response(status_code, body, headers)
@@ -1,10 +1,68 @@
 import logging
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from utils.aws_utils import get_client_for_resource
 
 logger = logging.getLogger()
 
+# SNS client created once per execution environment and reused across warm invocations
+sns_client = get_client_for_resource('sns')
+
+# PublishBatch accepts at most 10 entries per call
+PUBLISH_BATCH_SIZE = 10
+
+# Notification email templates, built once at import; only the optional
+# sections are formatted per message
+_VERIFIED_SUBJECT = "✅ Attendance Verified Successfully"
+_VERIFIED_DETAILS = "Verification Details:\n- Face Match Confidence: {score:.1f}%\n\n"
+_VERIFIED_TEMPLATE = "\n".join([
+    "Hello,",
+    "",
+    "Your attendance has been successfully verified!",
+    "",
+    "{details}Please log in to your Smart Attendance Tracker account to view complete details including:",
+    "- Verification timestamp",
+    "- Attendance history",
+    "- Full verification report",
+    "",
+    "Thank you for using Smart Attendance Tracker.",
+    "",
+    "---",
+    "Smart Attendance Team",
+    "",
+    "Note: This is an automated notification. Please do not reply to this email."
+])
+_VERIFIED_MESSAGE_NO_DETAILS = _VERIFIED_TEMPLATE.format(details='')
+
+_FAILED_SUBJECT = "❌ Attendance Verification Failed"
+_FAILED_REASON = "Reason:\n- {error_message}\n\n"
+_FAILED_SCORE = "Face Match Score: {score:.1f}% (Threshold: 80.0%)\n\n"
+_FAILED_TEMPLATE = "\n".join([
+    "Hello,",
+    "",
+    "Your recent attendance verification attempt was unsuccessful.",
+    "",
+    "{reason}{score}Please try again with the following tips:",
+    "- Ensure good lighting conditions",
+    "- Keep your face clearly visible and centered",
+    "- Make sure only your face is in the frame",
+    "- Avoid wearing sunglasses or face coverings",
+    "- Hold the camera steady",
+    "",
+    "Log in to your Smart Attendance Tracker account to:",
+    "- View the detailed failure reason",
+    "- Retry attendance verification",
+    "- View your attendance history",
+    "",
+    "---",
+    "Smart Attendance Team",
+    "",
+    "If you continue experiencing issues, please contact support.",
+    "",
+    "Note: This is an automated notification. Please do not reply to this email."
+])
+_FAILED_MESSAGE_NO_DETAILS = _FAILED_TEMPLATE.format(reason='', score='')
+
 
 def subscribe_user_to_notifications(
         topic_arn: str,
@@ -23,8 +81,6 @@ def subscribe_user_to_notifications(
     Raises:
         Exception: If subscription fails
     """
-    sns_client = get_client_for_resource('sns')
-
     try:
         response = sns_client.subscribe(
             TopicArn=topic_arn,
@@ -35,17 +91,54 @@ def subscribe_user_to_notifications(
         subscription_arn = response['SubscriptionArn']
 
         logger.info(
-            f"Subscribed {user_email} to notification topic. "
-            f"Subscription ARN: {subscription_arn}"
+            "Subscribed %s to notification topic. "
+            "Subscription ARN: %s",
+            user_email, subscription_arn
         )
 
         return subscription_arn
 
     except Exception as e:
-        logger.error(f"Failed to subscribe {user_email} to SNS topic: {str(e)}")
+        logger.error("Failed to subscribe %s to SNS topic: %s", user_email, e)
         raise Exception(f"Failed to subscribe to notification topic: {str(e)}")
 
 
+def _build_attendance_notification(
+        status: str,
+        similarity_score: Optional[float] = None,
+        error_message: Optional[str] = None
+) -> Tuple[str, str]:
+    """
+    Build the email subject and message for an attendance notification.
+
+    Args:
+        status: Verification status ('verified' or 'failed')
+        similarity_score: Face similarity score (0-100), optional
+        error_message: Error message if verification failed, optional
+
+    Returns:
+        Tuple of (subject, message)
+    """
+    # Prepare email content based on status
+    if status == 'verified':
+        subject = _VERIFIED_SUBJECT
+        if similarity_score is None:
+            message = _VERIFIED_MESSAGE_NO_DETAILS
+        else:
+            message = _VERIFIED_TEMPLATE.format(details=_VERIFIED_DETAILS.format(score=similarity_score))
+
+    else:  # status == 'failed'
+        subject = _FAILED_SUBJECT
+        if not error_message and similarity_score is None:
+            message = _FAILED_MESSAGE_NO_DETAILS
+        else:
+            reason = _FAILED_REASON.format(error_message=error_message) if error_message else ''
+            score = _FAILED_SCORE.format(score=similarity_score) if similarity_score is not None else ''
+            message = _FAILED_TEMPLATE.format(reason=reason, score=score)
+
+    return subject, message
+
+
 def publish_attendance_notification(
         topic_arn: str,
         status: str,
@@ -65,88 +158,7 @@ def publish_attendance_notification(
     Raises:
         Exception: If publish fails
     """
-    sns_client = get_client_for_resource('sns')
-
-    # Prepare email content based on status
-    if status == 'verified':
-        subject = "✅ Attendance Verified Successfully"
-
-        # Build success message with optional similarity score
-        message_lines = [
-            "Hello,",
-            "",
-            "Your attendance has been successfully verified!",
-            ""
-        ]
-
-        if similarity_score is not None:
-            message_lines.extend([
-                "Verification Details:",
-                f"- Face Match Confidence: {similarity_score:.1f}%",
-                ""
-            ])
-
-        message_lines.extend([
-            "Please log in to your Smart Attendance Tracker account to view complete details including:",
-            "- Verification timestamp",
-            "- Attendance history",
-            "- Full verification report",
-            "",
-            "Thank you for using Smart Attendance Tracker.",
-            "",
-            "---",
-            "Smart Attendance Team",
-            "",
-            "Note: This is an automated notification. Please do not reply to this email."
-        ])
-
-        message = "\n".join(message_lines)
-
-    else:  # status == 'failed'
-        subject = "❌ Attendance Verification Failed"
-
-        message_lines = [
-            "Hello,",
-            "",
-            "Your recent attendance verification attempt was unsuccessful.",
-            ""
-        ]
-
-        if error_message:
-            message_lines.extend([
-                "Reason:",
-                f"- {error_message}",
-                ""
-            ])
-
-        if similarity_score is not None:
-            message_lines.extend([
-                f"Face Match Score: {similarity_score:.1f}% (Threshold: 80.0%)",
-                ""
-            ])
-
-        message_lines.extend([
-            "Please try again with the following tips:",
-            "- Ensure good lighting conditions",
-            "- Keep your face clearly visible and centered",
-            "- Make sure only your face is in the frame",
-            "- Avoid wearing sunglasses or face coverings",
-            "- Hold the camera steady",
-            "",
-            "Log in to your Smart Attendance Tracker account to:",
-            "- View the detailed failure reason",
-            "- Retry attendance verification",
-            "- View your attendance history",
-            "",
-            "---",
-            "Smart Attendance Team",
-            "",
-            "If you continue experiencing issues, please contact support.",
-            "",
-            "Note: This is an automated notification. Please do not reply to this email."
-        ])
-
-        message = "\n".join(message_lines)
+    subject, message = _build_attendance_notification(status, similarity_score, error_message)
 
     try:
         response = sns_client.publish(
@@ -156,16 +168,68 @@ def publish_attendance_notification(
         )
 
         logger.info(
-            f"Published {status} notification. "
-            f"Message ID: {response['MessageId']}, "
-            f"Similarity: {similarity_score}"
+            "Published %s notification. "
+            "Message ID: %s, "
+            "Similarity: %s",
+            status, response['MessageId'], similarity_score
         )
 
     except Exception as e:
-        logger.error(f"Failed to publish {status} notification: {str(e)}")
+        logger.error("Failed to publish %s notification: %s", status, e)
         raise Exception(f"Failed to send {status} notification: {str(e)}")
 
 
+def publish_attendance_notifications_batch(
+        topic_arn: str,
+        notifications: List[Dict[str, Any]]
+) -> int:
+    """
+    Publish several attendance notifications with SNS PublishBatch.
+
+    Sends up to 10 messages per request instead of one publish call each.
+
+    Args:
+        topic_arn: ARN of the notification topic
+        notifications: Dicts with 'status' and optional 'similarity_score'
+            and 'error_message', as accepted by publish_attendance_notification
+
+    Returns:
+        Number of notifications that were not published. A failed
+        PublishBatch request counts its whole chunk; later chunks are
+        still sent.
+    """
+    failed_count = 0
+
+    for start in range(0, len(notifications), PUBLISH_BATCH_SIZE):
+        chunk = notifications[start:start + PUBLISH_BATCH_SIZE]
+        entries = []
+        for index, notification in enumerate(chunk):
+            subject, message = _build_attendance_notification(
+                notification['status'],
+                notification.get('similarity_score'),
+                notification.get('error_message')
+            )
+            entries.append({'Id': str(index), 'Subject': subject, 'Message': message})
+
+        try:
+            response = sns_client.publish_batch(TopicArn=topic_arn, PublishBatchRequestEntries=entries)
+        except Exception as e:
+            logger.error("Failed to publish batch of %s notifications: %s", len(chunk), e)
+            failed_count += len(chunk)
+            continue
+
+        for failure in response.get('Failed', []):
+            logger.error(
+                "Failed to publish %s notification: %s",
+                chunk[int(failure['Id'])]['status'], failure.get('Message')
+            )
+        failed_count += len(response.get('Failed', []))
+
+        logger.info("Published %s notifications in one batch", len(response.get('Successful', [])))
+
+    return failed_count
+
+
 def unsubscribe_from_topic(subscription_arn: str) -> None:
     """
     Unsubscribe a user from an SNS topic.
@@ -176,12 +240,10 @@ def unsubscribe_from_topic(subscription_arn: str) -> None:
     Raises:
         Exception: If unsubscribe fails
     """
-    sns_client = get_client_for_resource('sns')
-
     try:
         sns_client.unsubscribe(SubscriptionArn=subscription_arn)
-        logger.info(f"Unsubscribed from topic. Subscription ARN: {subscription_arn}")
+        logger.info("Unsubscribed from topic. Subscription ARN: %s", subscription_arn)
 
     except Exception as e:
-        logger.error(f"Failed to unsubscribe: {str(e)}")
+        logger.error("Failed to unsubscribe: %s", e)
         raise Exception(f"Failed to unsubscribe from notifications: {str(e)}")
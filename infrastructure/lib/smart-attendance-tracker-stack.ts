@@ -32,10 +32,14 @@ export class SmartAttendanceTrackerStack extends Stack {
     public readonly registerStudentFaceLambdaLogGroup: logs.LogGroup;
     public readonly createStudentProfileLambda: lambda.Function;
     public readonly createStudentProfileLambdaLogGroup: logs.LogGroup;
+    public readonly postSignupSideEffectsLambda: lambda.Function;
+    public readonly postSignupSideEffectsLambdaLogGroup: logs.LogGroup;
     public readonly getStudentProfileLambda: lambda.Function;
     public readonly getStudentProfileLambdaLogGroup: logs.LogGroup;
+    public readonly getStudentProfileLambdaAlias: lambda.Alias;
     public readonly updateStudentProfileLambda: lambda.Function;
     public readonly updateStudentProfileLambdaLogGroup: logs.LogGroup;
+    public readonly updateStudentProfileLambdaAlias: lambda.Alias;
     public readonly getStudentCoursesLambda: lambda.Function;
     public readonly getStudentCoursesLambdaLogGroup: logs.LogGroup;
     public readonly processAttendanceLambda: lambda.Function;
@@ -48,12 +52,18 @@ export class SmartAttendanceTrackerStack extends Stack {
     public readonly listUniversitiesLambdaLogGroup: logs.LogGroup;
     public readonly upsertUniversityLambda: lambda.Function;
     public readonly upsertUniversityLambdaLogGroup: logs.LogGroup;
+    public readonly backfillUniversityNameKeysLambda: lambda.Function;
+    public readonly backfillUniversityNameKeysLambdaLogGroup: logs.LogGroup;
+    public readonly rekeyUniversitiesLambda: lambda.Function;
+    public readonly rekeyUniversitiesLambdaLogGroup: logs.LogGroup;
     public readonly getScheduleLambda: lambda.Function;
     public readonly getScheduleLambdaLogGroup: logs.LogGroup;
     public readonly upsertScheduleLambda: lambda.Function;
     public readonly upsertScheduleLambdaLogGroup: logs.LogGroup;
     public readonly listStudentsLambda: lambda.Function;
     public readonly listStudentsLambdaLogGroup: logs.LogGroup;
+    public readonly backfillStudentNameKeysLambda: lambda.Function;
+    public readonly backfillStudentNameKeysLambdaLogGroup: logs.LogGroup;
     public readonly getStudentEnrollmentsLambda: lambda.Function;
     public readonly getStudentEnrollmentsLambdaLogGroup: logs.LogGroup;
     public readonly enrollStudentLambda: lambda.Function;
@@ -169,6 +179,13 @@ export class SmartAttendanceTrackerStack extends Stack {
             sortKey: {name: 'created_at', type: dynamodb.AttributeType.STRING},
         });
 
+        // Add GSI for listing students in name order with a Query instead of a Scan
+        this.studentsTable.addGlobalSecondaryIndex({
+            indexName: 'by-tenant-name',
+            partitionKey: {name: 'tenant', type: dynamodb.AttributeType.STRING},
+            sortKey: {name: 'name_sort_key', type: dynamodb.AttributeType.STRING},
+        });
+
         // Create a StudentAttendance DynamoDB table for storing attendance records
         this.studentAttendanceTable = new dynamodb.Table(this, 'StudentAttendanceTable', {
             tableName: 'attendance-tracker-student-attendance',
@@ -233,6 +250,13 @@ export class SmartAttendanceTrackerStack extends Stack {
             partitionKey: {name: 'university_code', type: dynamodb.AttributeType.STRING},
         });
 
+        // Add GSI for listing universities in name order with a Query instead of a Scan
+        this.universitiesTable.addGlobalSecondaryIndex({
+            indexName: 'by-tenant-name',
+            partitionKey: {name: 'tenant', type: dynamodb.AttributeType.STRING},
+            sortKey: {name: 'name_sort_key', type: dynamodb.AttributeType.STRING},
+        });
+
         // Create a StudentCourses DynamoDB table for storing student course enrollments
         this.studentCoursesTable = new dynamodb.Table(this, 'StudentCoursesTable', {
             tableName: 'attendance-tracker-student-courses',
@@ -407,6 +431,10 @@ export class SmartAttendanceTrackerStack extends Stack {
                             'cp -r /asset-input/university/shared /asset-output/python/university/',
                             'cp -r /asset-input/schedule/shared /asset-output/python/schedule/',
                             'pip install -r /asset-input/requirements.txt -t /asset-output/python --upgrade',
+                            // /opt is read-only at runtime, so ship bytecode instead of recompiling on every cold start.
+                            // Asset zips reset file mtimes, so timestamp-validated .pyc files would never match their
+                            // source; unchecked-hash bytecode is used as-is. -f replaces any copied __pycache__ entries.
+                            'python -m compileall -q -f --invalidation-mode unchecked-hash /asset-output/python/utils /asset-output/python/constants /asset-output/python/student /asset-output/python/attendance /asset-output/python/university /asset-output/python/schedule',
                         ].join(' && ')
                     ],
                 },
@@ -417,21 +445,30 @@ export class SmartAttendanceTrackerStack extends Stack {
             removalPolicy: cdk.RemovalPolicy.DESTROY,
         });
 
-        this.createStudentProfileLambdaLogGroup = new logs.LogGroup(this, 'CreateStudentProfileLogGroup', {
-            logGroupName: '/aws/lambda/create-student-profile',
+        // Profile handlers start from a 1024 MB Lambda Power Tuning baseline: CPU scales with
+        // memory, and boto3 client initialization dominates their cold start
+        const profileLambdaMemorySize = 1024;
+
+        // User-facing profile endpoints keep one pre-initialized environment so requests
+        // do not pay for boto3 client construction on a cold start
+        const profileProvisionedConcurrency = 1;
+
+        this.postSignupSideEffectsLambdaLogGroup = new logs.LogGroup(this, 'PostSignupSideEffectsLogGroup', {
+            logGroupName: '/aws/lambda/post-signup-side-effects',
             retention: logs.RetentionDays.ONE_WEEK,
             removalPolicy: cdk.RemovalPolicy.DESTROY,
         });
 
-        this.createStudentProfileLambda = new lambda.Function(this, 'CreateStudentProfileFunction', {
+        // Runs SNS subscription and Cognito group assignment off the PostConfirmation critical path
+        this.postSignupSideEffectsLambda = new lambda.Function(this, 'PostSignupSideEffectsFunction', {
             runtime: lambda.Runtime.PYTHON_3_13,
             architecture: lambda.Architecture.ARM_64,
-            handler: 'create_student_profile.handler',
+            handler: 'post_signup_side_effects.handler',
             code: lambda.Code.fromAsset('../backend/src/lambda/student/profile'),
-            functionName: 'create-student-profile',
+            functionName: 'post-signup-side-effects',
             timeout: cdk.Duration.seconds(30),
-            memorySize: 256,
-            logGroup: this.createStudentProfileLambdaLogGroup,
+            memorySize: profileLambdaMemorySize,
+            logGroup: this.postSignupSideEffectsLambdaLogGroup,
             layers: [this.sharedLambdaLayer],
             environment: {
                 STUDENTS_TABLE_NAME: this.studentsTable.tableName,
@@ -439,26 +476,50 @@ export class SmartAttendanceTrackerStack extends Stack {
             },
         });
 
-        this.studentsTable.grantWriteData(this.createStudentProfileLambda);
-
-        // Grant SNS permissions to create_student_profile Lambda
-        this.attendanceNotificationTopic.grantPublish(this.createStudentProfileLambda);
+        this.studentsTable.grantWriteData(this.postSignupSideEffectsLambda);
 
-        // Grant SNS subscribe permission to create_student_profile Lambda
-        this.createStudentProfileLambda.addToRolePolicy(new iam.PolicyStatement({
+        // Grant SNS subscribe permission to post_signup_side_effects Lambda
+        this.postSignupSideEffectsLambda.addToRolePolicy(new iam.PolicyStatement({
             effect: iam.Effect.ALLOW,
             actions: ['sns:Subscribe'],
             resources: [this.attendanceNotificationTopic.topicArn],
         }));
 
-        // Grant Cognito permissions to create_student_profile Lambda for group assignment
+        // Grant Cognito permissions to post_signup_side_effects Lambda for group assignment
         // Note: Using wildcard to avoid circular dependency with UserPool trigger
-        this.createStudentProfileLambda.addToRolePolicy(new iam.PolicyStatement({
+        this.postSignupSideEffectsLambda.addToRolePolicy(new iam.PolicyStatement({
             effect: iam.Effect.ALLOW,
             actions: ['cognito-idp:AdminAddUserToGroup'],
             resources: ['*'],
         }));
 
+        this.createStudentProfileLambdaLogGroup = new logs.LogGroup(this, 'CreateStudentProfileLogGroup', {
+            logGroupName: '/aws/lambda/create-student-profile',
+            retention: logs.RetentionDays.ONE_WEEK,
+            removalPolicy: cdk.RemovalPolicy.DESTROY,
+        });
+
+        this.createStudentProfileLambda = new lambda.Function(this, 'CreateStudentProfileFunction', {
+            runtime: lambda.Runtime.PYTHON_3_13,
+            architecture: lambda.Architecture.ARM_64,
+            handler: 'create_student_profile.handler',
+            code: lambda.Code.fromAsset('../backend/src/lambda/student/profile'),
+            functionName: 'create-student-profile',
+            timeout: cdk.Duration.seconds(30),
+            memorySize: profileLambdaMemorySize,
+            logGroup: this.createStudentProfileLambdaLogGroup,
+            layers: [this.sharedLambdaLayer],
+            environment: {
+                STUDENTS_TABLE_NAME: this.studentsTable.tableName,
+                POST_SIGNUP_FUNCTION_NAME: this.postSignupSideEffectsLambda.functionName,
+            },
+        });
+
+        this.studentsTable.grantWriteData(this.createStudentProfileLambda);
+
+        // Allow create_student_profile to hand off side effects asynchronously
+        this.postSignupSideEffectsLambda.grantInvoke(this.createStudentProfileLambda);
+
         this.userPool.addTrigger(
             cognito.UserPoolOperation.POST_CONFIRMATION,
             this.createStudentProfileLambda
@@ -477,7 +538,7 @@ export class SmartAttendanceTrackerStack extends Stack {
             code: lambda.Code.fromAsset('../backend/src/lambda/student/profile'),
             functionName: 'get-student-profile',
             timeout: cdk.Duration.seconds(10),
-            memorySize: 256,
+            memorySize: profileLambdaMemorySize,
             logGroup: this.getStudentProfileLambdaLogGroup,
             layers: [this.sharedLambdaLayer],
             environment: {
@@ -487,6 +548,12 @@ export class SmartAttendanceTrackerStack extends Stack {
 
         this.studentsTable.grantReadData(this.getStudentProfileLambda);
 
+        this.getStudentProfileLambdaAlias = new lambda.Alias(this, 'GetStudentProfileAlias', {
+            aliasName: 'live',
+            version: this.getStudentProfileLambda.currentVersion,
+            provisionedConcurrentExecutions: profileProvisionedConcurrency,
+        });
+
         this.updateStudentProfileLambdaLogGroup = new logs.LogGroup(this, 'UpdateStudentProfileLogGroup', {
             logGroupName: '/aws/lambda/update-student-profile',
             retention: logs.RetentionDays.ONE_WEEK,
@@ -500,7 +567,7 @@ export class SmartAttendanceTrackerStack extends Stack {
             code: lambda.Code.fromAsset('../backend/src/lambda/student/profile'),
             functionName: 'update-student-profile',
             timeout: cdk.Duration.seconds(10),
-            memorySize: 256,
+            memorySize: profileLambdaMemorySize,
             logGroup: this.updateStudentProfileLambdaLogGroup,
             layers: [this.sharedLambdaLayer],
             environment: {
@@ -510,6 +577,12 @@ export class SmartAttendanceTrackerStack extends Stack {
 
         this.studentsTable.grantReadWriteData(this.updateStudentProfileLambda);
 
+        this.updateStudentProfileLambdaAlias = new lambda.Alias(this, 'UpdateStudentProfileAlias', {
+            aliasName: 'live',
+            version: this.updateStudentProfileLambda.currentVersion,
+            provisionedConcurrentExecutions: profileProvisionedConcurrency,
+        });
+
         this.getStudentCoursesLambdaLogGroup = new logs.LogGroup(this, 'GetStudentCoursesLogGroup', {
             logGroupName: '/aws/lambda/get-student-courses',
             retention: logs.RetentionDays.ONE_WEEK,
@@ -603,6 +676,54 @@ export class SmartAttendanceTrackerStack extends Stack {
 
         this.universitiesTable.grantReadWriteData(this.upsertUniversityLambda);
 
+        // One-off migration adding pre-GSI universities to by-tenant-name; invoked manually
+        this.backfillUniversityNameKeysLambdaLogGroup = new logs.LogGroup(this, 'BackfillUniversityNameKeysLogGroup', {
+            logGroupName: '/aws/lambda/backfill-university-name-keys',
+            retention: logs.RetentionDays.ONE_WEEK,
+            removalPolicy: cdk.RemovalPolicy.DESTROY,
+        });
+
+        this.backfillUniversityNameKeysLambda = new lambda.Function(this, 'BackfillUniversityNameKeysFunction', {
+            runtime: lambda.Runtime.PYTHON_3_13,
+            architecture: lambda.Architecture.ARM_64,
+            handler: 'backfill_name_sort_keys.handler',
+            code: lambda.Code.fromAsset('../backend/src/lambda/university'),
+            functionName: 'backfill-university-name-keys',
+            timeout: cdk.Duration.minutes(5),
+            memorySize: 256,
+            logGroup: this.backfillUniversityNameKeysLambdaLogGroup,
+            layers: [this.sharedLambdaLayer],
+            environment: {
+                UNIVERSITIES_TABLE_NAME: this.universitiesTable.tableName,
+            },
+        });
+
+        this.universitiesTable.grantReadWriteData(this.backfillUniversityNameKeysLambda);
+
+        // One-off migration moving pre-uuid5 universities to code-derived IDs; invoked manually
+        this.rekeyUniversitiesLambdaLogGroup = new logs.LogGroup(this, 'RekeyUniversitiesLogGroup', {
+            logGroupName: '/aws/lambda/rekey-universities',
+            retention: logs.RetentionDays.ONE_WEEK,
+            removalPolicy: cdk.RemovalPolicy.DESTROY,
+        });
+
+        this.rekeyUniversitiesLambda = new lambda.Function(this, 'RekeyUniversitiesFunction', {
+            runtime: lambda.Runtime.PYTHON_3_13,
+            architecture: lambda.Architecture.ARM_64,
+            handler: 'rekey_universities.handler',
+            code: lambda.Code.fromAsset('../backend/src/lambda/university'),
+            functionName: 'rekey-universities',
+            timeout: cdk.Duration.minutes(5),
+            memorySize: 256,
+            logGroup: this.rekeyUniversitiesLambdaLogGroup,
+            layers: [this.sharedLambdaLayer],
+            environment: {
+                UNIVERSITIES_TABLE_NAME: this.universitiesTable.tableName,
+            },
+        });
+
+        this.universitiesTable.grantReadWriteData(this.rekeyUniversitiesLambda);
+
         // Schedule Lambda Functions
         this.getScheduleLambdaLogGroup = new logs.LogGroup(this, 'GetScheduleLogGroup', {
             logGroupName: '/aws/lambda/get-schedule',
@@ -674,6 +795,30 @@ export class SmartAttendanceTrackerStack extends Stack {
 
         this.studentsTable.grantReadData(this.listStudentsLambda);
 
+        // One-off migration adding pre-GSI students to by-tenant-name; invoked manually
+        this.backfillStudentNameKeysLambdaLogGroup = new logs.LogGroup(this, 'BackfillStudentNameKeysLogGroup', {
+            logGroupName: '/aws/lambda/backfill-student-name-keys',
+            retention: logs.RetentionDays.ONE_WEEK,
+            removalPolicy: cdk.RemovalPolicy.DESTROY,
+        });
+
+        this.backfillStudentNameKeysLambda = new lambda.Function(this, 'BackfillStudentNameKeysFunction', {
+            runtime: lambda.Runtime.PYTHON_3_13,
+            architecture: lambda.Architecture.ARM_64,
+            handler: 'backfill_name_sort_keys.handler',
+            code: lambda.Code.fromAsset('../backend/src/lambda/student'),
+            functionName: 'backfill-student-name-keys',
+            timeout: cdk.Duration.minutes(5),
+            memorySize: 256,
+            logGroup: this.backfillStudentNameKeysLambdaLogGroup,
+            layers: [this.sharedLambdaLayer],
+            environment: {
+                STUDENTS_TABLE_NAME: this.studentsTable.tableName,
+            },
+        });
+
+        this.studentsTable.grantReadWriteData(this.backfillStudentNameKeysLambda);
+
         this.getStudentEnrollmentsLambdaLogGroup = new logs.LogGroup(this, 'GetStudentEnrollmentsLogGroup', {
             logGroupName: '/aws/lambda/get-student-enrollments',
             retention: logs.RetentionDays.ONE_WEEK,
@@ -922,7 +1067,7 @@ export class SmartAttendanceTrackerStack extends Stack {
         });
 
         // Create Lambda integration for get_student_profile
-        const getStudentProfileIntegration = new apigateway.LambdaIntegration(this.getStudentProfileLambda, {
+        const getStudentProfileIntegration = new apigateway.LambdaIntegration(this.getStudentProfileLambdaAlias, {
             proxy: true,
             allowTestInvoke: true,
         });
@@ -935,7 +1080,7 @@ export class SmartAttendanceTrackerStack extends Stack {
         });
 
         // Create Lambda integration for update_student_profile
-        const updateStudentProfileIntegration = new apigateway.LambdaIntegration(this.updateStudentProfileLambda, {
+        const updateStudentProfileIntegration = new apigateway.LambdaIntegration(this.updateStudentProfileLambdaAlias, {
             proxy: true,
             allowTestInvoke: true,
         });